@@ -0,0 +1,133 @@
+import time
+import os
+
+IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.webp']
+
+def normalize_title(text):
+    """Lowercase, hyphens as spaces and single spaces between words."""
+    return ' '.join(text.replace("-", " ").split()).lower()
+
+class CoverIndex:
+    """
+    Lookup index for the covers under ./images/games/.
+
+    Built once per directory listing and rebuilt when the directory mtime
+    changes. A game name is matched in two steps:
+    1. Exact match of the cleaned name (hash map, .png > .jpg > .jpeg > .webp)
+    2. Longest cover name contained in the game name, hyphens ignored
+       (Aho-Corasick automaton over every cover name)
+    so a lookup costs roughly the length of the game name instead of a scan
+    over every cover.
+    """
+    def __init__(self, directory="./images/games/", recheck_interval=1.0):
+        self.directory = directory
+        self.recheck_interval = recheck_interval
+        self.mtime_ns = None
+        self.last_check = 0.0
+        self.exact = {}
+        self.results = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._best = [None]
+
+    def lookup(self, cleaned_name):
+        """Return the path of the best cover for an already cleaned game name, or None."""
+        self.refresh()
+        if cleaned_name in self.results:
+            return self.results[cleaned_name]
+
+        image = self.exact.get(cleaned_name.lower())
+        if image is None:
+            image = self._longest_contained(normalize_title(cleaned_name))
+        path = os.path.join(self.directory, image) if image else None
+        self.results[cleaned_name] = path
+        return path
+
+    def refresh(self, force=False):
+        """Rebuild the index if the cover directory changed since it was built."""
+        now = time.monotonic()
+        if not force and self.mtime_ns is not None and now - self.last_check < self.recheck_interval:
+            return
+        self.last_check = now
+
+        try:
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        if force or mtime_ns != self.mtime_ns:
+            self.mtime_ns = mtime_ns
+            self._build()
+
+    def _build(self):
+        try:
+            images = os.listdir(self.directory)
+        except OSError:
+            images = []
+
+        self.exact = {}
+        self.results = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._best = [None]
+
+        # rank: (-length, listing order), smaller is better
+        for order, img in enumerate(images):
+            root, ext = os.path.splitext(img)
+            ext = ext.lower()
+            if ext not in IMAGE_EXTENSIONS:
+                continue
+
+            key = root.lower()
+            current = self.exact.get(key)
+            if current is None or IMAGE_EXTENSIONS.index(ext) < IMAGE_EXTENSIONS.index(os.path.splitext(current)[1].lower()):
+                self.exact[key] = img
+
+            pattern = normalize_title(root)
+            if pattern:
+                self._add_pattern(pattern, (-len(pattern), order, img))
+
+        self._link()
+
+    def _add_pattern(self, pattern, rank):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(None)
+            node = nxt
+        if self._best[node] is None or rank < self._best[node]:
+            self._best[node] = rank
+
+    def _link(self):
+        """Compute failure links breadth first, propagating the best match down them."""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                inherited = self._best[self._fail[child]]
+                if inherited is not None and (self._best[child] is None or inherited < self._best[child]):
+                    self._best[child] = inherited
+                queue.append(child)
+
+    def _longest_contained(self, text):
+        best = None
+        node = 0
+        for ch in text:
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            rank = self._best[node]
+            if rank is not None and (best is None or rank < best):
+                best = rank
+        return best[2] if best else None
@@ -0,0 +1,184 @@
+import threading
+import sqlite3
+import json
+import os
+import re
+
+# Bump when the stored layout changes, older indexes are dropped and rebuilt
+SCHEMA_VERSION = 2
+
+# Placeholders of the [Templates] commands, replaced in a single pass so an
+# emulator path containing "game" is left alone
+TEMPLATE_PLACEHOLDERS = re.compile(r'exepath|game')
+
+def render_command(template, exe_path, rom_path):
+    """Fill a [Templates] command with the emulator executable and the quoted ROM path."""
+    values = {'exepath': exe_path, 'game': f'"{rom_path}"'}
+    return TEMPLATE_PLACEHOLDERS.sub(lambda m: values[m.group(0)], template)
+
+class GameRecord:
+    """Everything needed to show and launch one game of the library."""
+    __slots__ = ('name', 'emulator', 'exe_path', 'rom_path', 'command', 'size')
+
+    def __init__(self, name, emulator, exe_path, rom_path, command, size=0):
+        self.name = name
+        self.emulator = emulator
+        self.exe_path = exe_path
+        self.rom_path = rom_path
+        self.command = command
+        self.size = size  # bytes, as recorded by the library index
+
+class LibraryIndex:
+    """
+    Persistent index of the games folders listed under [Emulators].
+
+    Every games directory is stored with its modification time and the list
+    of entries it contained when it was last scanned, with their sizes for the
+    'file_size' ordering. Adding, removing or renaming a ROM updates the
+    directory mtime, so a directory only has to be listed again when its mtime
+    differs from the stored one.
+
+    The index is shared between the GUI thread and the library scanner, every
+    access goes through self.lock.
+    """
+    def __init__(self, db_path='games_library.db'):
+        self.db_path = db_path
+        self.conn = None
+        self.lock = threading.RLock()
+        self.sizes = {}  # path -> {entry: bytes} of the directories listed on this run
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS directories")
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS directories (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    entries TEXT NOT NULL,
+                    sizes TEXT NOT NULL
+                )
+            """)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            # Index is only an optimization, keep working without it
+            print(f"Library index unavailable ({e}), scanning without it.")
+            self.conn = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def list_dir(self, path):
+        """
+        Return the entries of a directory, from the index when the directory
+        mtime did not change since it was stored, otherwise from disk.
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        with self.lock:
+            if self.conn is not None:
+                row = self.conn.execute(
+                    "SELECT mtime_ns, entries FROM directories WHERE path = ?", (path,)
+                ).fetchone()
+                if row and row[0] == mtime_ns:
+                    self.hits += 1
+                    return json.loads(row[1])
+
+        self.misses += 1
+        entries = []
+        sizes = []
+        with os.scandir(path) as it:
+            for entry in it:
+                entries.append(entry.name)
+                sizes.append(self._entry_size(entry))
+        self.store(path, mtime_ns, entries, sizes)
+        return entries
+
+    @staticmethod
+    def _entry_size(entry):
+        try:
+            return entry.stat().st_size if entry.is_file() else 0
+        except OSError:
+            return 0
+
+    def cached_entries(self, path):
+        """
+        Return the stored entries of a directory without touching the disk, or
+        None if it was never indexed. Used to show the library before the scan.
+        """
+        with self.lock:
+            if self.conn is None:
+                return None
+            row = self.conn.execute(
+                "SELECT entries FROM directories WHERE path = ?", (path,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def entry_sizes(self, path):
+        """Return {entry: bytes} of a directory as last listed, without touching the disk."""
+        with self.lock:
+            sizes = self.sizes.get(path)
+            if sizes is not None or self.conn is None:
+                return sizes or {}
+            row = self.conn.execute(
+                "SELECT entries, sizes FROM directories WHERE path = ?", (path,)
+            ).fetchone()
+        return dict(zip(json.loads(row[0]), json.loads(row[1]))) if row else {}
+
+    def directory_mtimes(self):
+        """Return {path: mtime_ns} of every indexed directory, without touching the disk."""
+        with self.lock:
+            if self.conn is None:
+                return {}
+            return dict(self.conn.execute("SELECT path, mtime_ns FROM directories"))
+
+    def store(self, path, mtime_ns, entries, sizes):
+        with self.lock:
+            self.sizes[path] = dict(zip(entries, sizes))
+            if self.conn is None:
+                return
+            try:
+                with self.conn:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO directories (path, mtime_ns, entries, sizes) VALUES (?, ?, ?, ?)",
+                        (path, mtime_ns, json.dumps(entries), json.dumps(sizes))
+                    )
+            except sqlite3.Error as e:
+                print(f"Failed to update library index for '{path}': {e}")
+
+    def forget(self, path):
+        """Drop a directory so it is listed from disk on the next lookup."""
+        with self.lock:
+            self.sizes.pop(path, None)
+            if self.conn is None:
+                return
+            with self.conn:
+                self.conn.execute("DELETE FROM directories WHERE path = ?", (path,))
+
+    def prune(self, keep_paths):
+        """Remove directories that are no longer configured."""
+        with self.lock:
+            keep = set(keep_paths)
+            self.sizes = {p: s for p, s in self.sizes.items() if p in keep}
+            if self.conn is None:
+                return
+            stale = [(p,) for (p,) in self.conn.execute("SELECT path FROM directories") if p not in keep]
+            if stale:
+                with self.conn:
+                    self.conn.executemany("DELETE FROM directories WHERE path = ?", stale)
+
+    def clear(self):
+        """Forget every directory, forcing a full rescan."""
+        with self.lock:
+            self.sizes = {}
+            if self.conn is None:
+                return
+            with self.conn:
+                self.conn.execute("DELETE FROM directories")
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
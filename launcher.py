@@ -0,0 +1,123 @@
+import subprocess
+import threading
+import time
+import sys
+import os
+
+class LaunchHook:
+    """One `?program:script=params` entry of a [Templates] command."""
+    __slots__ = ('program', 'script', 'args')
+
+    def __init__(self, program, script, args):
+        self.program = program
+        self.script = script
+        self.args = args
+
+    @property
+    def label(self):
+        return os.path.basename(self.script)
+
+def split_arguments(text):
+    """
+    Split a command line the way cmd.exe did for the templates: spaces outside
+    double quotes separate arguments, quotes are removed and a quoted part and
+    the text right after it stay one argument ("D:\\My Game"\\EBOOT.BIN).
+    Backslashes are kept as they are.
+    """
+    args = []
+    current = []
+    quoted = False
+    started = False  # an argument is open, even if it is an empty ""
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+            started = True
+        elif ch.isspace() and not quoted:
+            if started:
+                args.append(''.join(current))
+                current = []
+                started = False
+        else:
+            current.append(ch)
+            started = True
+    if started:
+        args.append(''.join(current))
+    return args
+
+def parse_launch_command(command, vcontroller):
+    """
+    Split a rendered template into the emulator command and its launch hooks,
+    with emupath and vcontroller already replaced in the hook parameters.
+    """
+    if "?" not in command:
+        return command, []
+
+    command, hooks_text = command.split("?", 1)
+    emupath = os.path.dirname(command.split('"')[0])
+    hooks = []
+    for hook in hooks_text.split(","):
+        target, _, params = hook.partition("=")
+        program, _, script = target.partition(":")
+        params = params.replace('emupath', emupath).replace('vcontroller', vcontroller)
+        hooks.append(LaunchHook(program.strip(), script.strip(), split_arguments(params)))
+    return command, hooks
+
+class HookRunner:
+    """
+    Runs the launch hooks of a game before its emulator starts.
+
+    Python hooks (`?python:./scripts/...`) are executed in this process as
+    if they were run as scripts, their compiled code is cached until the file
+    changes, so a hook costs about the time of the file edit it makes instead
+    of starting an interpreter. Other programs are run through the shell as
+    before. Hooks run one after the other, in template order: the hooks of an
+    emulator usually edit the same configuration file.
+    """
+    def __init__(self):
+        self._code = {}  # script path -> (mtime_ns, code object)
+        self._argv_lock = threading.Lock()  # sys.argv is shared by the whole process
+
+    def run(self, hooks):
+        """Run every hook, return [(label, seconds), ...]."""
+        timings = []
+        for hook in hooks:
+            start = time.perf_counter()
+            try:
+                if hook.program.lower() in ('python', 'python3', 'py'):
+                    self._run_python(hook.script, hook.args)
+                else:
+                    self._run_program(hook)
+            except Exception as e:
+                print(f"Launch hook '{hook.script}' failed: {e}")
+            timings.append((hook.label, time.perf_counter() - start))
+        return timings
+
+    def _compiled(self, script):
+        path = os.path.abspath(script)
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._code.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            with open(path, 'rb') as f:
+                cached = (mtime_ns, compile(f.read(), path, 'exec'))
+            self._code[path] = cached
+        return path, cached[1]
+
+    def _run_python(self, script, args):
+        path, code = self._compiled(script)
+        with self._argv_lock:
+            saved_argv = sys.argv
+            sys.argv = [path] + list(args)
+            try:
+                exec(code, {'__name__': '__main__', '__file__': path, '__builtins__': __builtins__})
+            except SystemExit as e:
+                if e.code not in (None, 0):
+                    print(f"Launch hook '{script}' exited with {e.code}")
+            finally:
+                sys.argv = saved_argv
+
+    def _run_program(self, hook):
+        command = ' '.join([hook.program, hook.script] + [f'"{arg}"' if ' ' in arg else arg for arg in hook.args])
+        print("Running command: ", command)
+        result = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        for line in result.stdout.splitlines():
+            print(line.strip())
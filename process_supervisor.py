@@ -0,0 +1,113 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from collections import deque
+from launcher import split_arguments
+import subprocess
+import threading
+import platform
+import ctypes
+import time
+
+# Windows priority classes, see SetPriorityClass
+NORMAL_PRIORITY_CLASS = 0x00000020
+BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
+
+def set_low_priority(low):
+    """
+    Lower (or restore) the priority of the hub process so a running game gets
+    the CPU first. Windows only: elsewhere an unprivileged process cannot raise
+    its priority back, so nothing is changed. Returns True if it was applied.
+    """
+    if platform.system() != "Windows":
+        return False
+    try:
+        kernel32 = ctypes.windll.kernel32
+        priority = BELOW_NORMAL_PRIORITY_CLASS if low else NORMAL_PRIORITY_CLASS
+        return bool(kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), priority))
+    except (AttributeError, OSError) as e:
+        print(f"Failed to change the hub priority: {e}")
+        return False
+
+class GameSession:
+    """A launched emulator: process id, start time and, once it exited, exit code and runtime."""
+    __slots__ = ('game_name', 'command', 'process', 'pid', 'started', 'exit_code', 'runtime')
+
+    def __init__(self, game_name, command, process):
+        self.game_name = game_name
+        self.command = command
+        self.process = process
+        self.pid = process.pid
+        self.started = time.monotonic()
+        self.exit_code = None
+        self.runtime = None
+
+class ProcessSupervisor(QObject):
+    """
+    Starts the emulators and keeps track of them.
+
+    Commands are run without a shell. stdout and stderr are merged into one
+    pipe drained by a small thread per process into a bounded ring buffer
+    (self.output), so a chatty emulator can never block on a full pipe and
+    nothing is sent to the GUI per line. The same thread records the exit
+    code and runtime and emits session_finished, delivered queued to the Qt
+    thread. Nothing waits for the children when the hub closes.
+    """
+    session_finished = pyqtSignal(object)  # GameSession
+
+    def __init__(self, output_lines=1000, history=50):
+        super().__init__()
+        self.output = deque(maxlen=output_lines)  # (game name, line)
+        self.running = {}  # pid -> GameSession
+        self.history = deque(maxlen=history)  # finished GameSessions, newest last
+        self.lock = threading.Lock()
+
+    def launch(self, game_name, command):
+        """Start command for game_name, return its GameSession or None if it could not be started."""
+        args = split_arguments(command)
+        if not args:
+            print(f"Nothing to run for '{game_name}'")
+            return None
+        try:
+            process = subprocess.Popen(
+                # Windows: CreateProcess parses the rendered template itself, as cmd.exe did
+                command if platform.system() == "Windows" else args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                # keep SIGPIPE ignored (POSIX) so an emulator that outlives the hub
+                # does not die writing to the closed pipe
+                restore_signals=False,
+            )
+        except OSError as e:
+            print(f"Failed to start '{command}': {e}")
+            return None
+
+        session = GameSession(game_name, command, process)
+        with self.lock:
+            self.running[session.pid] = session
+        print(f"Started {game_name} (pid {session.pid}): {command}")
+        threading.Thread(target=self._drain, args=(session,), name=f"Emulator-{session.pid}", daemon=True).start()
+        return session
+
+    def _drain(self, session):
+        for raw in session.process.stdout:
+            self.output.append((session.game_name, raw.decode(errors='replace').rstrip()))
+        session.process.stdout.close()
+        session.exit_code = session.process.wait()
+        session.runtime = time.monotonic() - session.started
+        with self.lock:
+            self.running.pop(session.pid, None)
+            self.history.append(session)
+        self.session_finished.emit(session)
+
+    def tail(self, game_name=None, lines=20):
+        """Last lines of output, of every emulator or of one game."""
+        return [line for name, line in list(self.output) if game_name is None or name == game_name][-lines:]
+
+    def shutdown(self):
+        """Forget the running emulators without waiting for them, they keep running."""
+        with self.lock:
+            running = list(self.running.values())
+            self.running.clear()
+        for session in running:
+            print(f"Leaving {session.game_name} (pid {session.pid}) running")
+        try:
+            self.session_finished.disconnect()
+        except TypeError:
+            pass  # nothing connected
@@ -0,0 +1,85 @@
+import threading
+import time
+import io
+import os
+
+class SettingsStore:
+    """
+    Write-behind persistence of the settings ConfigParser.
+
+    save() only takes a text snapshot of the config; the file is written by a
+    background thread once no other save() came in for `delay` seconds, so a
+    burst of changes (volume slider, favorite toggles) costs a single write.
+    Writes go to a temporary file that is then renamed over the settings file,
+    so a crash mid-write never leaves a truncated settings.ini behind.
+    """
+    def __init__(self, config, path='settings.ini', delay=0.5):
+        self.config = config
+        self.path = path
+        self.delay = delay
+        self.writes = 0
+        self._pending = None
+        self._deadline = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # one writer at a time, newest snapshot last
+        self._thread = threading.Thread(target=self._run, name="SettingsStore", daemon=True)
+        self._thread.start()
+
+    def save(self):
+        """Schedule a write of the current config."""
+        text = self._snapshot()
+        with self._cond:
+            self._pending = text
+            self._deadline = time.monotonic() + self.delay
+            closed = self._closed
+            self._cond.notify()
+        if closed:
+            self.flush()
+
+    def flush(self):
+        """Write any pending change now, on the calling thread."""
+        with self._write_lock:
+            with self._cond:
+                text, self._pending = self._pending, None
+            if text is not None:
+                self._write(text)
+
+    def close(self):
+        """Flush and stop the writer thread; later saves are written synchronously."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+        self.flush()
+
+    def _snapshot(self):
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        return buffer.getvalue()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # debounce: wait until no new save arrived for `delay` seconds
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+            self.flush()
+
+    def _write(self, text):
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self.writes += 1
+        except OSError as e:
+            print(f"Failed to save settings to '{self.path}': {e}")
@@ -0,0 +1,122 @@
+import math
+import time
+
+# Orderings offered in the "Order by" menu, also cycled with the Y button
+SORT_ORDERINGS = ['alphabetical', 'emulator', 'last_played', 'play_count', 'play_time', 'file_size', 'system_release']
+
+# Release year of the system each emulator (key of [Settings]) runs, for 'system_release'
+SYSTEM_RELEASE_YEARS = {
+    'visualboyadvance-m': 1989,
+    'duckstation': 1994,
+    'project64': 1996,
+    'pcsx2': 2000,
+    'xemu': 2001,
+    'dolphin': 2001,
+    'desmume': 2004,
+    'ppsspp': 2004,
+    'xenia': 2005,
+    'rpcs3': 2006,
+    'citra': 2011,
+    'yuzu': 2017,
+    'eden': 2017,
+}
+
+# Orderings never stored in games_cache.json: the last played groups depend on
+# the current time and ROM sizes can change without the folder mtime changing
+UNCACHED_ORDERINGS = ('last_played', 'file_size')
+
+DAY = 24 * 60 * 60
+
+# (group, lower bound) pairs, first match wins
+LAST_PLAYED_GROUPS = [('Today', DAY), ('Week', 7 * DAY), ('Month', 30 * DAY), ('Year', 365 * DAY)]
+PLAY_COUNT_GROUPS = [('10+', 10), ('5+', 5), ('2+', 2), ('1', 1), ('0', 0)]
+PLAY_TIME_GROUPS = [('10h+', 36000), ('1h+', 3600), ('<1h', 1), ('Never', 0)]
+FILE_SIZE_GROUPS = [('4GB+', 4 << 30), ('1GB+', 1 << 30), ('100MB+', 100 << 20), ('<100MB', 0)]
+
+class SortIndex:
+    """
+    Grouped orderings of the library.
+
+    Games are referred to by id, their position in self.names, so an ordering
+    is a list of [group, [ids]] pairs that can be stored in games_cache.json
+    without repeating every name. Each ordering is one pass to compute its
+    keys, one sort and one pass to split it into groups.
+    """
+    def __init__(self, names=()):
+        self.names = list(names)
+
+    def build(self, ordering, game_to_emulator, play_stats, file_sizes):
+        """
+        Return [[group, [ids]], ...] for an ordering of SORT_ORDERINGS.
+
+        game_to_emulator: game name -> emulator key
+        play_stats: game name -> {'count': int, 'last_played': epoch seconds, 'play_seconds': float}
+        file_sizes: game name -> ROM size in bytes, only read for 'file_size'
+        """
+        names = self.names
+        ids = range(len(names))
+
+        match ordering:
+            case 'emulator':
+                emulators = [game_to_emulator.get(name, 'Unknown') for name in names]
+                return self._grouped(ids, emulators, sorted(set(emulators)))
+
+            case 'system_release':
+                emulators = [game_to_emulator.get(name, 'Unknown') for name in names]
+                keys = sorted(set(emulators), key=lambda emu: (SYSTEM_RELEASE_YEARS.get(emu, 9999), emu))
+                return self._grouped(ids, emulators, keys)
+
+            case 'last_played':
+                now = time.time()
+                last = [play_stats.get(name, {}).get('last_played', 0) for name in names]
+                order = sorted(ids, key=lambda i: -last[i])
+                groups = []
+                for i in order:
+                    if not last[i]:
+                        groups.append('Never')
+                        continue
+                    age = now - last[i]
+                    groups.append(next((g for g, limit in LAST_PLAYED_GROUPS if age < limit), 'Older'))
+                return self._split(order, groups)
+
+            case 'play_count':
+                counts = [play_stats.get(name, {}).get('count', 0) for name in names]
+                order = sorted(ids, key=lambda i: -counts[i])
+                return self._split(order, [self._bucket(counts[i], PLAY_COUNT_GROUPS) for i in order])
+
+            case 'play_time':
+                # rounded up: any recorded play time counts as played, not 'Never'
+                seconds = [math.ceil(play_stats.get(name, {}).get('play_seconds', 0)) for name in names]
+                order = sorted(ids, key=lambda i: -seconds[i])
+                return self._split(order, [self._bucket(seconds[i], PLAY_TIME_GROUPS) for i in order])
+
+            case 'file_size':
+                size = [file_sizes.get(name, 0) for name in names]
+                order = sorted(ids, key=lambda i: -size[i])
+                return self._split(order, [self._bucket(size[i], FILE_SIZE_GROUPS) for i in order])
+
+            case _:
+                letters = [name[0].upper() for name in names]
+                return self._grouped(ids, letters, sorted(set(letters)))
+
+    def _grouped(self, ids, keys, group_order):
+        """Group ids by keys[id], keeping library order inside a group."""
+        groups = {key: [] for key in group_order}
+        for i in ids:
+            groups[keys[i]].append(i)
+        return [[key, groups[key]] for key in group_order]
+
+    def _split(self, order, groups):
+        """Cut an ordered id list into runs of the same group."""
+        result = []
+        for i, group in zip(order, groups):
+            if not result or result[-1][0] != group:
+                result.append([group, []])
+            result[-1][1].append(i)
+        return result
+
+    def _bucket(self, value, buckets):
+        for group, lower in buckets:
+            if value >= lower:
+                return group
+        return buckets[-1][0]
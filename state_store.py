@@ -0,0 +1,170 @@
+import threading
+import sqlite3
+import time
+import json
+import os
+
+# Bump when the stored layout changes (add the migration in _migrate)
+SCHEMA_VERSION = 1
+
+RECENTS_LIMIT = 9
+
+class StateStore:
+    """
+    Favorites, recently launched games and play statistics, in one SQLite
+    database (WAL journal) with in-memory mirrors.
+
+    Every read goes to the mirrors (self.favorites, self.recents, self.stats),
+    the database is only written when something changes, so switching tabs or
+    building an ordering never touches the disk. self.stats has the layout
+    SortIndex expects: {game: {'count': n, 'last_played': epoch, 'play_seconds': s}}.
+
+    On the first run the old storage is imported: the [FavoriteGames] section
+    of settings.ini and games_recent.json.
+    """
+    def __init__(self, db_path='games_state.db'):
+        self.db_path = db_path
+        self.conn = None
+        self.lock = threading.Lock()
+        self.favorites = set()
+        self.recents = []
+        self.stats = {}
+        self.imported = False  # True when the old storage was imported on this run
+
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            with self.conn:
+                self.conn.execute("CREATE TABLE IF NOT EXISTS favorites (name TEXT PRIMARY KEY)")
+                self.conn.execute("CREATE TABLE IF NOT EXISTS recents (name TEXT PRIMARY KEY, launched_at REAL NOT NULL)")
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS stats (
+                        name TEXT PRIMARY KEY,
+                        launches INTEGER NOT NULL DEFAULT 0,
+                        last_played INTEGER NOT NULL DEFAULT 0,
+                        play_seconds REAL NOT NULL DEFAULT 0
+                    )
+                """)
+            self.imported = version == 0
+            self._load()
+        except sqlite3.Error as e:
+            # Keep working from memory, nothing is remembered across runs
+            print(f"State store unavailable ({e}), favorites and recents will not be saved.")
+            self.conn = None
+
+    def _load(self):
+        self.favorites = {name for (name,) in self.conn.execute("SELECT name FROM favorites")}
+        self.recents = [name for (name,) in self.conn.execute(
+            "SELECT name FROM recents ORDER BY launched_at DESC LIMIT ?", (RECENTS_LIMIT,))]
+        self.stats = {
+            name: {'count': launches, 'last_played': last_played, 'play_seconds': play_seconds}
+            for name, launches, last_played, play_seconds in self.conn.execute(
+                "SELECT name, launches, last_played, play_seconds FROM stats")
+        }
+
+    def migrate(self, config, recents_file):
+        """
+        Import the favorites and recents kept before this store existed. Only
+        done once, when the database was just created. Returns True if the
+        [FavoriteGames] section was moved out of config.
+        """
+        if not self.imported or self.conn is None:
+            return False
+
+        favorites = []
+        if config.has_section('FavoriteGames'):
+            favorites = [config.get('FavoriteGames', key) for key in config.options('FavoriteGames')]
+        recents = self._read_json(recents_file, list)
+
+        now = time.time()
+        with self.lock:
+            try:
+                with self.conn:
+                    self.conn.executemany("INSERT OR IGNORE INTO favorites (name) VALUES (?)", [(name,) for name in favorites])
+                    # keep the old order: the first entry is the most recent
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO recents (name, launched_at) VALUES (?, ?)",
+                        [(name, now - i) for i, name in enumerate(recents[:RECENTS_LIMIT]) if isinstance(name, str)])
+                    self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                self._load()
+            except sqlite3.Error as e:
+                print(f"Failed to import favorites and recents: {e}")
+                return False
+
+        self.imported = False
+        if favorites or recents:
+            print(f"Imported {len(favorites)} favorites and {len(recents)} recents into {self.db_path}")
+        if config.has_section('FavoriteGames'):
+            config.remove_section('FavoriteGames')
+            return True
+        return False
+
+    def _read_json(self, path, kind):
+        if not os.path.exists(path):
+            return kind()
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, kind) else kind()
+        except Exception as e:
+            print(f"Failed to read '{path}': {e}")
+            return kind()
+
+    def set_favorite(self, name, favorite):
+        if favorite:
+            self.favorites.add(name)
+            self._execute("INSERT OR IGNORE INTO favorites (name) VALUES (?)", (name,))
+        else:
+            self.favorites.discard(name)
+            self._execute("DELETE FROM favorites WHERE name = ?", (name,))
+
+    def record_launch(self, name):
+        """Move name to the top of the recents and count the launch."""
+        now = time.time()
+        if name in self.recents:
+            self.recents.remove(name)
+        self.recents.insert(0, name)
+        dropped = self.recents[RECENTS_LIMIT:]
+        del self.recents[RECENTS_LIMIT:]
+
+        entry = self.stats.setdefault(name, {'count': 0, 'last_played': 0, 'play_seconds': 0.0})
+        entry['count'] += 1
+        entry['last_played'] = int(now)
+
+        self._execute_many([
+            ("INSERT OR REPLACE INTO recents (name, launched_at) VALUES (?, ?)", (name, now)),
+            *[("DELETE FROM recents WHERE name = ?", (old,)) for old in dropped],
+            ("""INSERT INTO stats (name, launches, last_played) VALUES (?, 1, ?)
+                ON CONFLICT(name) DO UPDATE SET launches = launches + 1, last_played = excluded.last_played""",
+             (name, int(now))),
+        ])
+
+    def add_play_time(self, name, seconds):
+        """Add the duration of a finished session to the game's play time."""
+        entry = self.stats.setdefault(name, {'count': 0, 'last_played': 0, 'play_seconds': 0.0})
+        entry['play_seconds'] += seconds
+        self._execute("""INSERT INTO stats (name, play_seconds) VALUES (?, ?)
+                         ON CONFLICT(name) DO UPDATE SET play_seconds = play_seconds + excluded.play_seconds""",
+                      (name, seconds))
+
+    def _execute(self, sql, params):
+        self._execute_many([(sql, params)])
+
+    def _execute_many(self, statements):
+        with self.lock:
+            if self.conn is None:
+                return
+            try:
+                with self.conn:
+                    for sql, params in statements:
+                        self.conn.execute(sql, params)
+            except sqlite3.Error as e:
+                print(f"Failed to update {self.db_path}: {e}")
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from cover_index import CoverIndex
+
+
+def make_covers(directory, *names):
+    for name in names:
+        (directory / name).write_bytes(b'')
+
+
+def test_exact_match_prefers_png(tmp_path):
+    make_covers(tmp_path, 'Halo.jpg', 'Halo.png', 'halo 2.webp')
+    index = CoverIndex(str(tmp_path))
+    assert index.lookup('Halo') == os.path.join(str(tmp_path), 'Halo.png')
+    assert index.lookup('Halo 2') == os.path.join(str(tmp_path), 'halo 2.webp')
+
+
+def test_longest_contained_cover_wins(tmp_path):
+    make_covers(tmp_path, 'pokemon.png', 'pokemon emerald.png', 'mario.png')
+    index = CoverIndex(str(tmp_path))
+    assert index.lookup('Pokemon - Emerald Version') == os.path.join(str(tmp_path), 'pokemon emerald.png')
+    assert index.lookup('Pokemon Ruby') == os.path.join(str(tmp_path), 'pokemon.png')
+    assert index.lookup('Super Mario-Sunshine') == os.path.join(str(tmp_path), 'mario.png')
+
+
+def test_hyphens_and_spacing_are_ignored(tmp_path):
+    make_covers(tmp_path, 'zelda-ocarina  of time.png')
+    index = CoverIndex(str(tmp_path))
+    assert index.lookup('The Legend of Zelda Ocarina of Time') == os.path.join(str(tmp_path), 'zelda-ocarina  of time.png')
+
+
+def test_no_match_and_other_files(tmp_path):
+    make_covers(tmp_path, 'tetris.txt', 'doom.png')
+    index = CoverIndex(str(tmp_path))
+    assert index.lookup('Tetris') is None
+    assert index.lookup('Quake') is None
+
+
+def test_missing_directory(tmp_path):
+    index = CoverIndex(str(tmp_path / 'missing'))
+    assert index.lookup('Halo') is None
+
+
+def test_rebuilt_when_the_directory_changes(tmp_path):
+    index = CoverIndex(str(tmp_path), recheck_interval=0)
+    assert index.lookup('Halo') is None
+
+    make_covers(tmp_path, 'halo.png')
+    # make sure the directory mtime moves even on coarse clocks
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert index.lookup('Halo') == os.path.join(str(tmp_path), 'halo.png')
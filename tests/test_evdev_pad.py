@@ -0,0 +1,107 @@
+import os
+import sys
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import xinput_utils
+
+libevdev = xinput_utils.libevdev
+if libevdev is None:
+    pytest.skip("libevdev is not available", allow_module_level=True)
+
+from libevdev import InputEvent, EV_ABS, EV_KEY, EV_SYN
+
+
+class FakeDevice:
+    """Stands in for libevdev.Device: fixed axis ranges and a queue of events."""
+    def __init__(self, ranges):
+        # like Device.absinfo, an axis the pad does not have is None
+        self.absinfo = defaultdict(lambda: None, {
+            libevdev.evbit(EV_ABS.value, code.value): SimpleNamespace(minimum=lo, maximum=hi)
+            for code, (lo, hi) in ranges.items()
+        })
+        self.queue = []
+
+    def has(self, code):
+        return code.type == EV_ABS and self.absinfo[libevdev.evbit(EV_ABS.value, code.value)] is not None
+
+    def events(self):
+        queue, self.queue = self.queue, []
+        yield from queue
+
+
+def make_pad(ranges=None):
+    if ranges is None:
+        ranges = {
+            EV_ABS.ABS_X: (0, 255), EV_ABS.ABS_Y: (0, 255),
+            EV_ABS.ABS_RX: (-32768, 32767), EV_ABS.ABS_RY: (-32768, 32767),
+            EV_ABS.ABS_Z: (0, 1023), EV_ABS.ABS_RZ: (0, 1023),
+        }
+    device = FakeDevice(ranges)
+    return xinput_utils.EvdevPad('fake', device=device), device
+
+
+def feed(pad, device, *events):
+    device.queue.extend(events)
+    return pad.read()
+
+
+def report():
+    return InputEvent(EV_SYN.SYN_REPORT, 0)
+
+
+def test_buttons_and_hat():
+    pad, device = make_pad()
+    assert feed(pad, device,
+                InputEvent(EV_KEY.BTN_SOUTH, 1), InputEvent(EV_KEY.BTN_START, 1),
+                InputEvent(EV_ABS.ABS_HAT0X, -1), InputEvent(EV_ABS.ABS_HAT0Y, 1),
+                report())
+    # A, Start, D-pad left and down
+    assert pad.state.Gamepad.wButtons == 0x1000 | 0x0010 | 0x0004 | 0x0002
+
+    feed(pad, device, InputEvent(EV_KEY.BTN_SOUTH, 0), InputEvent(EV_ABS.ABS_HAT0X, 0), report())
+    assert pad.state.Gamepad.wButtons == 0x0010 | 0x0002
+
+
+def test_sticks_are_scaled_and_y_points_up():
+    pad, device = make_pad()
+    feed(pad, device,
+         InputEvent(EV_ABS.ABS_X, 255), InputEvent(EV_ABS.ABS_Y, 0),
+         InputEvent(EV_ABS.ABS_RX, -32768), InputEvent(EV_ABS.ABS_RY, 32767),
+         report())
+    gamepad = pad.state.Gamepad
+    assert gamepad.sThumbLX == 32767
+    assert gamepad.sThumbLY == 32767  # evdev up is the minimum
+    assert gamepad.sThumbRX == -32768
+    assert gamepad.sThumbRY == -32768
+
+
+def test_triggers_are_scaled_to_a_byte():
+    pad, device = make_pad()
+    feed(pad, device, InputEvent(EV_ABS.ABS_Z, 1023), InputEvent(EV_ABS.ABS_RZ, 0), report())
+    assert pad.state.Gamepad.bLeftTrigger & 0xFF == 255
+    assert pad.state.Gamepad.bRightTrigger & 0xFF == 0
+
+
+def test_digital_triggers_without_an_analog_axis():
+    pad, device = make_pad({EV_ABS.ABS_X: (0, 255), EV_ABS.ABS_Y: (0, 255)})
+    feed(pad, device, InputEvent(EV_KEY.BTN_TL2, 1), report())
+    assert pad.state.Gamepad.bLeftTrigger & 0xFF == 255
+    assert pad.state.Gamepad.bRightTrigger & 0xFF == 0
+
+
+def test_packet_number_only_moves_on_a_changed_report():
+    pad, device = make_pad()
+    assert not feed(pad, device, InputEvent(EV_KEY.BTN_EAST, 1))
+    assert pad.state.dwPacketNumber == 0 and pad.state.Gamepad.wButtons == 0
+
+    assert feed(pad, device, report())
+    assert pad.state.dwPacketNumber == 1 and pad.state.Gamepad.wButtons == 0x2000
+
+    # same state again: no new packet
+    assert not feed(pad, device, InputEvent(EV_KEY.BTN_EAST, 1), report())
+    assert pad.state.dwPacketNumber == 1
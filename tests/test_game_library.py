@@ -0,0 +1,91 @@
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game_library import LibraryIndex, SCHEMA_VERSION, render_command
+
+
+def touch_dir(path):
+    """Move the directory mtime forward, some filesystems only keep whole seconds."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def make_games(tmp_path):
+    games = tmp_path / 'games'
+    games.mkdir()
+    (games / 'A.iso').write_bytes(b'x' * 10)
+    (games / 'B.iso').write_bytes(b'x' * 20)
+    return str(games)
+
+
+def test_unchanged_directory_comes_from_the_index(tmp_path):
+    games = make_games(tmp_path)
+    db_path = str(tmp_path / 'games_library.db')
+    index = LibraryIndex(db_path)
+    assert sorted(index.list_dir(games)) == ['A.iso', 'B.iso']
+    assert (index.hits, index.misses) == (0, 1)
+    index.close()
+
+    index = LibraryIndex(db_path)
+    assert sorted(index.cached_entries(games)) == ['A.iso', 'B.iso']
+    assert sorted(index.list_dir(games)) == ['A.iso', 'B.iso']
+    assert (index.hits, index.misses) == (1, 0)
+    assert index.entry_sizes(games) == {'A.iso': 10, 'B.iso': 20}
+    index.close()
+
+
+def test_changed_mtime_lists_again(tmp_path):
+    games = make_games(tmp_path)
+    index = LibraryIndex(str(tmp_path / 'games_library.db'))
+    index.list_dir(games)
+
+    os.remove(os.path.join(games, 'A.iso'))
+    (tmp_path / 'games' / 'C.iso').write_bytes(b'x' * 30)
+    touch_dir(games)
+    assert sorted(index.list_dir(games)) == ['B.iso', 'C.iso']
+    assert index.misses == 2
+    assert index.entry_sizes(games) == {'B.iso': 20, 'C.iso': 30}
+    index.close()
+
+
+def test_forget_prune_and_clear(tmp_path):
+    games = make_games(tmp_path)
+    index = LibraryIndex(str(tmp_path / 'games_library.db'))
+    index.list_dir(games)
+
+    index.forget(games)
+    assert index.cached_entries(games) is None
+    index.list_dir(games)
+    assert index.misses == 2
+
+    index.prune(['/elsewhere'])
+    assert index.directory_mtimes() == {}
+    assert index.entry_sizes(games) == {}
+
+    index.list_dir(games)
+    index.clear()
+    assert index.cached_entries(games) is None
+    index.close()
+
+
+def test_older_schema_is_dropped(tmp_path):
+    db_path = str(tmp_path / 'games_library.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE directories (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, entries TEXT NOT NULL)")
+    conn.execute("INSERT INTO directories VALUES ('/games', 1, '[\"A.iso\"]')")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+    conn.commit()
+    conn.close()
+
+    index = LibraryIndex(db_path)
+    assert index.conn is not None
+    assert index.cached_entries('/games') is None
+    index.close()
+
+
+def test_render_command_replaces_placeholders_once():
+    command = render_command('exepath -b -e game', '/emus/gamecube/dolphin', '/roms/My game.iso')
+    assert command == '/emus/gamecube/dolphin -b -e "/roms/My game.iso"'
@@ -0,0 +1,60 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from launcher import split_arguments, parse_launch_command
+from game_library import render_command
+
+# [Templates] entries of settings.ini
+YUZU = "exepath -f -g game ?python:./scripts/yuzucc.py=0 true,python:./scripts/yuzu_p1_xinput.py=vcontroller"
+EDEN = "exepath -f -g game ?python:./scripts/edencc.py=0 true,python:./scripts/eden_p1_xinput.py=vcontroller"
+RPCS3 = r"exepath --no-gui --fullscreen game\PS3_GAME\USRDIR\EBOOT.BIN"
+
+
+def test_spaces_separate_arguments():
+    assert split_arguments("emu.exe  -f\t-g ") == ["emu.exe", "-f", "-g"]
+
+
+def test_quoted_path_keeps_its_spaces():
+    assert split_arguments('emu.exe "D:\\My Games\\Some Game.iso"') == ["emu.exe", "D:\\My Games\\Some Game.iso"]
+
+
+def test_quoted_path_and_suffix_are_one_argument():
+    command = render_command(RPCS3, r"C:\rpcs3\rpcs3.exe", r"D:\ps3\My Game")
+    assert split_arguments(command) == [
+        r"C:\rpcs3\rpcs3.exe", "--no-gui", "--fullscreen", r"D:\ps3\My Game\PS3_GAME\USRDIR\EBOOT.BIN",
+    ]
+
+
+def test_quoted_executable():
+    command = render_command('"exepath" game', r"C:\Program Files\PPSSPP\PPSSPPWindows64.exe", r"D:\psp\A Game.iso")
+    assert split_arguments(command) == [r"C:\Program Files\PPSSPP\PPSSPPWindows64.exe", r"D:\psp\A Game.iso"]
+
+
+def test_empty_strings():
+    assert split_arguments("") == []
+    assert split_arguments("   ") == []
+    assert split_arguments('emu.exe "" -f') == ["emu.exe", "", "-f"]
+
+
+def test_command_without_hooks_is_unchanged():
+    command = render_command("exepath --fullscreen game", "/emus/xenia/xenia", "/roms/A Game.iso")
+    assert parse_launch_command(command, "1") == (command, [])
+
+
+def test_yuzu_and_eden_hooks():
+    for template, emulator in ((YUZU, "yuzu"), (EDEN, "eden")):
+        command, hooks = parse_launch_command(render_command(template, f"/emus/{emulator}/{emulator}.exe", "/roms/switch/A Game.nsp"), "2")
+        assert split_arguments(command) == [f"/emus/{emulator}/{emulator}.exe", "-f", "-g", "/roms/switch/A Game.nsp"]
+        assert [(hook.program, hook.script, hook.args) for hook in hooks] == [
+            ("python", f"./scripts/{emulator}cc.py", ["0", "true"]),
+            ("python", f"./scripts/{emulator}_p1_xinput.py", ["2"]),
+        ]
+
+
+def test_emupath_is_the_emulator_folder():
+    template = "exepath game ?python:./scripts/p64fs.py=1 emupath"
+    _, hooks = parse_launch_command(render_command(template, "/emus/project64/Project64.exe", "/roms/n64/A Game.z64"), "0")
+    assert hooks[0].args == ["1", "/emus/project64"]
+    assert hooks[0].label == "p64fs.py"
@@ -0,0 +1,71 @@
+import configparser
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from settings_store import SettingsStore
+
+
+def make_store(tmp_path, delay=0.1):
+    config = configparser.ConfigParser()
+    config['MainWindow'] = {'nav_sound_volume': '75'}
+    return config, SettingsStore(config, str(tmp_path / 'settings.ini'), delay=delay)
+
+
+def read(path):
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
+def test_burst_of_saves_is_one_write(tmp_path):
+    config, store = make_store(tmp_path)
+    for volume in range(10):
+        config['MainWindow']['nav_sound_volume'] = str(volume)
+        store.save()
+    assert store.writes == 0
+
+    deadline = time.monotonic() + 5
+    while store.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    time.sleep(0.2)
+    assert store.writes == 1
+    assert read(store.path)['MainWindow']['nav_sound_volume'] == '9'
+    store.close()
+
+
+def test_close_flushes_pending_changes(tmp_path):
+    config, store = make_store(tmp_path, delay=60)
+    config['MainWindow']['nav_sound_volume'] = '20'
+    store.save()
+    store.close()
+    assert store.writes == 1
+    assert read(store.path)['MainWindow']['nav_sound_volume'] == '20'
+
+    # after close, saves are written right away
+    config['MainWindow']['nav_sound_volume'] = '30'
+    store.save()
+    assert read(store.path)['MainWindow']['nav_sound_volume'] == '30'
+
+
+def test_write_replaces_the_file_atomically(tmp_path):
+    path = tmp_path / 'settings.ini'
+    path.write_text('[MainWindow]\nnav_sound_volume = 1\n')
+    config, store = make_store(tmp_path, delay=60)
+    store.save()
+    store.flush()
+    assert read(store.path)['MainWindow']['nav_sound_volume'] == '75'
+    assert sorted(os.listdir(tmp_path)) == ['settings.ini']
+    store.close()
+
+
+def test_failed_write_is_not_raised(tmp_path):
+    config, store = make_store(tmp_path, delay=60)
+    store.path = str(tmp_path / 'missing' / 'settings.ini')
+    store.save()
+    store.flush()
+    assert store.writes == 0
+    assert not os.path.exists(store.path)
+    store.close()
@@ -0,0 +1,88 @@
+import configparser
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from state_store import StateStore, RECENTS_LIMIT
+
+
+def favorites_config(*names):
+    config = configparser.ConfigParser()
+    config['FavoriteGames'] = {f'game{i}': name for i, name in enumerate(names)}
+    return config
+
+
+def test_migrate_imports_once(tmp_path):
+    recents_file = tmp_path / 'games_recent.json'
+    recents_file.write_text(json.dumps(['B', 'A']))
+    db_path = str(tmp_path / 'games_state.db')
+
+    store = StateStore(db_path)
+    config = favorites_config('A', 'C')
+    assert store.migrate(config, str(recents_file))
+    assert not config.has_section('FavoriteGames')
+    assert store.favorites == {'A', 'C'}
+    assert store.recents == ['B', 'A']
+    store.close()
+
+    # already imported: the old files are not read again
+    recents_file.write_text(json.dumps(['D']))
+    store = StateStore(db_path)
+    assert not store.migrate(favorites_config('D'), str(recents_file))
+    assert store.favorites == {'A', 'C'}
+    assert store.recents == ['B', 'A']
+    store.close()
+
+
+def test_migrate_without_old_files(tmp_path):
+    store = StateStore(str(tmp_path / 'games_state.db'))
+    assert not store.migrate(configparser.ConfigParser(), str(tmp_path / 'missing.json'))
+    assert store.favorites == set() and store.recents == []
+    store.close()
+
+
+def test_recents_are_limited_and_survive_a_restart(tmp_path):
+    db_path = str(tmp_path / 'games_state.db')
+    store = StateStore(db_path)
+    for i in range(RECENTS_LIMIT + 3):
+        store.record_launch(f'Game {i}')
+    store.record_launch('Game 5')
+
+    expected = ['Game 5'] + [f'Game {i}' for i in range(RECENTS_LIMIT + 2, 2, -1) if i != 5][:RECENTS_LIMIT - 1]
+    assert store.recents == expected
+    store.close()
+
+    store = StateStore(db_path)
+    assert store.recents == expected
+    assert store.stats['Game 5']['count'] == 2
+    store.close()
+
+
+def test_favorites_and_play_time_are_stored(tmp_path):
+    db_path = str(tmp_path / 'games_state.db')
+    store = StateStore(db_path)
+    store.set_favorite('A', True)
+    store.set_favorite('B', True)
+    store.set_favorite('A', False)
+    store.record_launch('B')
+    store.add_play_time('B', 90.5)
+    store.add_play_time('B', 0.5)
+    store.close()
+
+    store = StateStore(db_path)
+    assert store.favorites == {'B'}
+    assert store.stats['B']['count'] == 1
+    assert store.stats['B']['play_seconds'] == 91.0
+    assert store.stats['B']['last_played'] > 0
+    store.close()
+
+
+def test_works_from_memory_without_a_database(tmp_path):
+    store = StateStore(str(tmp_path / 'missing' / 'games_state.db'))
+    assert store.conn is None
+    store.record_launch('A')
+    store.set_favorite('A', True)
+    assert store.recents == ['A'] and store.favorites == {'A'}
+    store.close()
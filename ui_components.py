@@ -1,16 +1,25 @@
-from PyQt5.QtWidgets import QLabel, QWidget, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QStackedWidget, QMainWindow, QAction, QDesktopWidget, QApplication, QCheckBox, QFileDialog, QScrollArea, QGridLayout, QScroller, QDialog, QShortcut, QMenu, QTextEdit, QComboBox, QListView, QGraphicsDropShadowEffect, QSlider
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QKeySequence, QRegion, QPainterPath
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl, QRunnable, QThreadPool, QObject, pyqtSlot
-from functools import lru_cache
+from PyQt5.QtWidgets import QLabel, QWidget, QFrame, QVBoxLayout, QHBoxLayout, QPushButton, QStackedWidget, QMainWindow, QAction, QDesktopWidget, QApplication, QCheckBox, QFileDialog, QScrollArea, QScroller, QDialog, QShortcut, QMenu, QTextEdit, QComboBox, QListView, QGraphicsDropShadowEffect, QSlider
+from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QKeySequence, QRegion, QPainterPath, QImage, QImageReader, QPainter, QBrush
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl, QRunnable, QThreadPool, QObject, pyqtSlot, QFileSystemWatcher, QSize
+from collections import OrderedDict
 from PyQt5.QtMultimedia import QSoundEffect
 from xinput_handler import XInputHandler
 from xinput_utils import xinput_connected_indices
 from virtual_pad_vg import VirtualX360
+from game_library import LibraryIndex, GameRecord, render_command
+from cover_index import CoverIndex
+from sort_index import SortIndex, SORT_ORDERINGS, UNCACHED_ORDERINGS
+from settings_store import SettingsStore
+from state_store import StateStore
+from launcher import HookRunner, parse_launch_command
+from process_supervisor import ProcessSupervisor, set_low_priority
 import hashlib, base64
+import threading
 import configparser
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import platform
 import time
+import math
 import sys
 import os
 import re
@@ -106,71 +115,387 @@ class AlwaysOnTopDialog(QDialog):
         self.setLayout(layout)
 
 
-class Worker(QThread):
-    output_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal()
+class LaunchWorker(QThread):
+    """Runs the launch hooks of a game off the GUI thread, the emulator is started when they are done."""
+    hooks_done = pyqtSignal(list)  # [(hook, seconds), ...]
 
-    def __init__(self, command):
+    def __init__(self, hook_runner, hooks):
         super().__init__()
-        self.command = command
-        self.process = None
+        self.hook_runner = hook_runner
+        self.hooks = hooks
 
     def run(self):
-        self.process = subprocess.Popen(self.command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        for line in self.process.stdout:
-            self.output_signal.emit(line.strip())
-        self.process.stdout.close()
-        self.process.wait()
-        self.finished_signal.emit()
+        self.hooks_done.emit(self.hook_runner.run(self.hooks))
+
+class LibraryScanner(QThread):
+    """
+    Lists the games folders off the GUI thread. The folders are listed
+    concurrently (one folder per pool thread, so folders on different drives
+    or shares do not wait for each other) and reported in configuration order
+    as soon as they are ready, so the grid fills in progressively. The scan
+    only reads: files with the same name in several folders are told apart
+    by MainWindow.rebuild_library.
+    """
+    folder_scanned = pyqtSignal(str, list)  # games path, game files
+    scan_error = pyqtSignal(str)
+
+    MAX_WORKERS = 8
+
+    def __init__(self, games_paths, excluded_extensions, library_index):
+        super().__init__()
+        self.games_paths = list(games_paths)
+        self.excluded_extensions = tuple(excluded_extensions)  # str.endswith() takes the whole tuple
+        self.library_index = library_index
+
+    def list_folder(self, game_path):
+        """Return the games of a folder (pool thread), or an error message."""
+        if self.isInterruptionRequested():
+            return None, None
+        try:
+            if not os.path.exists(game_path):
+                return None, f"Path does not exist: {game_path}"
+            if not os.path.isdir(game_path):
+                return None, f"Path is not a directory: {game_path}"
+            files = self.library_index.list_dir(game_path)
+            return [file for file in files if not file.endswith(self.excluded_extensions)], None
+        except Exception as e:
+            return None, f"Error processing path '{game_path}': {str(e)}"
+
+    def run(self):
+        if not self.games_paths:
+            return
+        pool = ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(self.games_paths)), thread_name_prefix="LibraryScanner")
+        try:
+            futures = [(game_path, pool.submit(self.list_folder, game_path)) for game_path in self.games_paths]
+            for game_path, future in futures:
+                if self.isInterruptionRequested():
+                    return
+                files, error = future.result()
+                if error:
+                    self.scan_error.emit(error)
+                elif files is not None:
+                    self.folder_scanned.emit(game_path, files)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
 class ImageCache:
-    def __init__(self):
-        self.cache = {}
+    """
+    In-memory pixmap cache bounded by a byte budget, evicting the least
+    recently used entries first. Sizes are estimated from the pixmap
+    dimensions and depth.
+    """
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        self.cache = OrderedDict()
+        self.max_bytes = max_bytes
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
 
     def get(self, key):
-        return self.cache.get(key)
+        pixmap = self.cache.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.cache.move_to_end(key)
+        return pixmap
 
     def put(self, key, pixmap):
+        if key in self.cache:
+            self.resident_bytes -= self.pixmap_bytes(self.cache.pop(key))
+        size = self.pixmap_bytes(pixmap)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
         self.cache[key] = pixmap
+        self.resident_bytes += size
+        self.trim(self.max_bytes)
+
+    def trim(self, max_bytes):
+        """Evict least recently used entries until at most max_bytes are resident."""
+        while self.cache and self.resident_bytes > max_bytes:
+            _, pixmap = self.cache.popitem(last=False)
+            self.resident_bytes -= self.pixmap_bytes(pixmap)
+            self.evictions += 1
+
+    def stats(self):
+        return {
+            'entries': len(self.cache),
+            'resident_bytes': self.resident_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+class ThumbnailCache:
+    """
+    On-disk cache of covers already scaled (and rounded) for a tile size.
+    Entries are keyed by (path, mtime, size, mode), so replacing a cover or
+    changing the tile size simply misses and stores a new thumbnail. The
+    thumbnails left behind are removed by prune(): a hit refreshes the file
+    mtime, and the thumbnails not used for the longest time go first once the
+    folder is over max_bytes.
+    """
+    def __init__(self, directory='cache/thumbnails', max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            print(f"Thumbnail cache disabled: {e}")
+            self.directory = None
+
+    def path_for(self, source_path, size, mode):
+        if self.directory is None:
+            return None
+        try:
+            mtime_ns = os.stat(source_path).st_mtime_ns
+        except OSError:
+            return None
+        key = f"{os.path.abspath(source_path)}|{mtime_ns}|{size}|{mode}"
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + '.png')
+
+    def load(self, thumb_path):
+        if not os.path.exists(thumb_path):
+            return None
+        image = QImage(thumb_path)
+        if image.isNull():
+            return None
+        try:
+            os.utime(thumb_path)  # last use, for prune()
+        except OSError:
+            pass
+        return image
+
+    def save(self, thumb_path, image):
+        # Write to a temporary file first so a crash never leaves a truncated PNG
+        tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+        try:
+            if image.save(tmp_path, 'PNG'):
+                os.replace(tmp_path, thumb_path)
+        except OSError as e:
+            print(f"Failed to store thumbnail {thumb_path}: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def prune(self):
+        """Remove the least recently used thumbnails until the folder fits in max_bytes."""
+        if self.directory is None:
+            return
+        thumbnails = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith('.png') or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    thumbnails.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        except OSError as e:
+            print(f"Failed to read the thumbnail cache: {e}")
+            return
+
+        removed = 0
+        thumbnails.sort()
+        for _, size, path in thumbnails:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            print(f"Thumbnail cache: removed {removed} unused thumbnail(s), {total / 1048576:.1f} MB kept.")
+
+def round_image_corners(image, radius=20):
+    """Return a copy of image with transparent, anti-aliased rounded corners."""
+    rounded = QImage(image.size(), QImage.Format_ARGB32_Premultiplied)
+    rounded.fill(Qt.transparent)
+    path = QPainterPath()
+    path.addRoundedRect(0, 0, image.width(), image.height(), radius, radius)
+    painter = QPainter(rounded)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QBrush(image))
+    painter.drawPath(path)
+    painter.end()
+    return rounded
 
 class WorkerSignals(QObject):
     finished = pyqtSignal()
     result = pyqtSignal(object)
 
 class ImageLoader(QRunnable):
-    def __init__(self, path, size, mode='inner'):
+    """
+    Decodes a cover straight at the size of the tile with QImageReader (JPEG
+    is decoded at a fraction of its resolution, a 4K cover never exists in
+    full in memory) and emits the small QImage. QPixmaps are only created on
+    the GUI thread.
+    """
+    def __init__(self, path, size, mode='inner', thumbnail_cache=None):
         super(ImageLoader, self).__init__()
         self.path = path
         self.size = size
         self.mode = mode # 'inner' or 'button'
+        self.thumbnail_cache = thumbnail_cache
         self.signals = WorkerSignals()
+        self.cancelled = False  # Set from the GUI thread, a queued loader then returns at once
 
     @pyqtSlot()
     def run(self):
         try:
+            if self.cancelled:
+                return
             if not os.path.exists(self.path):
                 self.signals.result.emit(None)
                 return
 
-            pixmap = QPixmap(self.path)
-            if pixmap.isNull():
+            thumb_path = self.thumbnail_cache.path_for(self.path, self.size, self.mode) if self.thumbnail_cache else None
+            if thumb_path:
+                thumbnail = self.thumbnail_cache.load(thumb_path)
+                if thumbnail is not None:
+                    # Already scaled and masked, no decode of the original needed
+                    self.signals.result.emit(thumbnail)
+                    return
+
+            image = self.read_scaled()
+            if image.isNull():
                 self.signals.result.emit(None)
                 return
 
             if self.mode == 'inner':
-                # Scale for inner button content (keep aspect ratio by expanding)
-                scaled_pixmap = pixmap.scaled(self.size, self.size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+                # Fill the square tile (keep aspect ratio by expanding), crop the
+                # overflow evenly and bake the rounded corners of the tile in
+                scaled = image.copy((image.width() - self.size) // 2, (image.height() - self.size) // 2, self.size, self.size)
+                scaled = round_image_corners(scaled)
             else:
                 # Scale for other uses if needed
-                scaled_pixmap = pixmap.scaled(self.size, self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            self.signals.result.emit(scaled_pixmap)
+                scaled = image
+
+            if thumb_path:
+                self.thumbnail_cache.save(thumb_path, scaled)
+
+            self.signals.result.emit(scaled)
         except Exception as e:
             print(f"Error loading image {self.path}: {e}")
             self.signals.result.emit(None)
         finally:
             self.signals.finished.emit()
 
+    def read_scaled(self):
+        """Decode the cover already scaled to cover (inner) or fit (button) a size x size square."""
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        source = reader.size()
+        if source.isValid() and source.width() > 0 and source.height() > 0:
+            ratios = (self.size / source.width(), self.size / source.height())
+            factor = max(ratios) if self.mode == 'inner' else min(ratios)
+            width = max(self.size if self.mode == 'inner' else 1, math.ceil(source.width() * factor))
+            height = max(self.size if self.mode == 'inner' else 1, math.ceil(source.height() * factor))
+            reader.setScaledSize(QSize(width, height))
+            return reader.read()
+
+        # The format does not report its size up front, decode and scale
+        image = reader.read()
+        if image.isNull():
+            return image
+        aspect = Qt.KeepAspectRatioByExpanding if self.mode == 'inner' else Qt.KeepAspectRatio
+        return image.scaled(self.size, self.size, aspect, Qt.SmoothTransformation)
+
+
+class DecodeScheduler(QObject):
+    """
+    Decodes covers on its own bounded QThreadPool.
+
+    Requests are keyed by (path, size): a key already queued or decoding is
+    not queued again, the single result is emitted once through `decoded`
+    and every tile showing that key picks it up. Each request is stamped with
+    the current generation; new_generation() starts a new one (a scroll or a
+    re-layout) and cancel_stale() drops the queued work nobody asked for
+    again since. Cancelled loaders still queued return without decoding.
+    """
+    decoded = pyqtSignal(object, object)  # cache key, QPixmap or None (created on the GUI thread)
+
+    def __init__(self, thumbnail_cache, max_threads=2):
+        super().__init__()
+        self.thumbnail_cache = thumbnail_cache
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(1, max_threads))
+        self.pending = {}  # cache key -> [ImageLoader, priority, generation]
+        self.generation = 0
+        self.requests = 0
+        self.deduplicated = 0
+        self.cancelled = 0
+
+    def new_generation(self):
+        self.generation += 1
+        return self.generation
+
+    def request(self, cache_key, priority=0):
+        """Queue the decode of cache_key unless it is already queued at this priority or higher."""
+        self.requests += 1
+        pending = self.pending.get(cache_key)
+        if pending is not None:
+            pending[2] = self.generation  # still wanted
+            if pending[1] >= priority:
+                self.deduplicated += 1
+                return
+            pending[0].cancelled = True  # queued again below, ahead of lower priorities
+
+        path, size = cache_key
+        loader = ImageLoader(path, size, mode='inner', thumbnail_cache=self.thumbnail_cache)
+        loader.signals.result.connect(lambda p, k=cache_key, l=loader: self._on_result(p, k, l))
+        self.pending[cache_key] = [loader, priority, self.generation]
+        self.pool.start(loader, priority)
+
+    def cancel_stale(self):
+        """Cancel the work queued by an older generation and not requested again."""
+        for cache_key in [k for k, (_, _, generation) in self.pending.items() if generation < self.generation]:
+            self._cancel(cache_key)
+
+    def cancel_all(self):
+        for cache_key in list(self.pending):
+            self._cancel(cache_key)
+
+    def _cancel(self, cache_key):
+        loader, _, _ = self.pending.pop(cache_key)
+        loader.cancelled = True
+        self.cancelled += 1
+
+    def _on_result(self, image, cache_key, loader):
+        pending = self.pending.get(cache_key)
+        if pending is not None and pending[0] is loader:
+            del self.pending[cache_key]
+        # delivered queued, so this runs on the GUI thread where QPixmap is safe
+        pixmap = QPixmap.fromImage(image) if image is not None and not image.isNull() else None
+        if not loader.cancelled or pixmap:
+            self.decoded.emit(cache_key, pixmap)
+
+    def shutdown(self, timeout_ms=1000):
+        self.cancel_all()
+        self.pool.clear()
+        self.pool.waitForDone(timeout_ms)
+
+    def stats(self):
+        return {
+            'threads': self.pool.maxThreadCount(),
+            'requests': self.requests,
+            'deduplicated': self.deduplicated,
+            'cancelled': self.cancelled,
+        }
+
 
 class QHLine(QFrame):
     def __init__(self):
@@ -178,6 +503,15 @@ class QHLine(QFrame):
         self.setFrameShape(QFrame.HLine)
         self.setFrameShadow(QFrame.Sunken)
 
+class GridCanvas(QWidget):
+    """Scroll area content for the game grid, tiles are placed on it by MainWindow."""
+    widthChanged = pyqtSignal()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.oldSize().width() != event.size().width():
+            self.widthChanged.emit()
+
 class TouchScrollArea(QScrollArea):
     screenTouched = pyqtSignal()  # Signal to indicate that the screen was touched
 
@@ -264,19 +598,38 @@ class Blocker(QWidget):
         event.accept()
 
 class MainWindow(QMainWindow):
+    GRID_MARGIN = 11  # Space around the game grid
+    GRID_SPACING = 10  # Space between grid rows/columns
+    GAME_MODE_CACHE_BYTES = 16 * 1024 * 1024  # Covers kept in memory while a game runs
+    TILE_PADDING = 8  # Space between a tile border and its cover
+
+    # Cover load priorities, higher runs first
+    COVER_PRIORITY_VISIBLE = 2
+    COVER_PRIORITY_SLACK = 1
+    COVER_PRIORITY_PREFETCH = 0
+
     def __init__(self, fullscreen=False, navbar=True, sort_by='alphabetical'):
         super().__init__()
         self.fullscreen = fullscreen
         self.navbar_visible = navbar
         self.sort_by = sort_by
         self.CACHE_FILE = 'games_cache.json'
-        self.RECENTS_FILE = 'games_recent.json'
+        self.RECENTS_FILE = 'games_recent.json'  # Imported once into STATE_FILE
+        self.STATE_FILE = 'games_state.db'
+        self.LIBRARY_FILE = 'games_library.db'
         self.config = configparser.ConfigParser()
         file_path = 'settings.ini'
         self.selected_row = -1  # Track the selected row in the grid
         self.selected_col = -1  # Track the selected column in the grid
         self.show_all_overlays = False # Flag to toggle game overlays
-        self.games_in_grid = []  # Track the games in the grid layout
+        self.games_in_grid = []  # Track the games in the grid layout (names per row)
+        self.row_offsets = []  # Slots taken by the header in each row
+        self.row_headers = []  # Header key of each row, None for continuation rows
+        self.grid_rows = {}  # Row -> widgets currently bound to it (visible rows only)
+        self.grid_tile_pool = []  # Unbound game tiles ready for reuse
+        self.grid_tile_pool_by_name = {}  # Pooled tiles still showing a game, reused as-is for it
+        self.grid_tile_size = 0
+        self.emulator_icon_cache = {}
         self.screen_touched = True  # Flag to track if the screen was touched (default to True for touch-first experience)
 
         self.config.read(file_path)
@@ -314,12 +667,20 @@ class MainWindow(QMainWindow):
                 self.config.write(configfile)
 
         self.config.read(file_path)
+        self.settings_store = SettingsStore(self.config, file_path)  # Debounced, atomic writes of settings.ini
         self.worker = None
         self.active_workers = []  # Track active workers
+        self.pending_launch = None  # Game whose launch hooks are running
+        self.hook_runner = HookRunner()  # Launch hooks run in-process, compiled once
+        self.process_supervisor = ProcessSupervisor()  # Running emulators and their output
+        self.process_supervisor.session_finished.connect(self.on_game_session_finished, Qt.QueuedConnection)
+        self.game_mode = False  # A launched game is running, the hub is suspended
+        self.game_mode_low_priority = self.config.getboolean('MainWindow', 'low_priority_while_playing', fallback=False)
+        self.last_launch_timings = []  # [(stage, seconds), ...] of the last launch
         self.game_names = []  # List to store game names
         self.game_to_emulator = {} # Map game name to emulator
-        self.available_game_images = None # Cache for available game images
-        self.game_executables = []
+        self.game_records = {}  # Game name -> GameRecord (emulator, executable, ROM path, command)
+        self.cover_index = CoverIndex("./images/games/") # Cover lookup, rebuilt when the folder changes
         self.emulators = []
         self.games_loaded = False # Flag to track if games are loaded
         self.init_errors = []  # Track initialization errors
@@ -330,10 +691,12 @@ class MainWindow(QMainWindow):
         self.nav_volume = self.config.getint('MainWindow', 'nav_sound_volume', fallback=75)
         self.nav_sound.setVolume(self.nav_volume / 100.0)
         
-        # Favorites system
-        self.favorite_games = set()  # Track favorited game names
+        # Favorites, recents and play stats, read from memory and saved to games_state.db
+        self.state_store = StateStore(self.STATE_FILE)
+        if self.state_store.migrate(self.config, self.RECENTS_FILE):
+            self.settings_store.save()  # [FavoriteGames] moved out of settings.ini
+        self.favorite_games = self.state_store.favorites  # Favorited (cleaned) game names
         self.current_grid = 'main'  # Track which grid is displayed ('main' or 'favorites')
-        self.load_favorites()  # Load favorites from settings.ini
         
         self.tabs = [
             {"key": "main", "label": "ALL"},
@@ -342,11 +705,36 @@ class MainWindow(QMainWindow):
         ]
         self.current_tab_index = 0
 
-        self.game_cache = {}  # Cache for sorted game lists
+        self.game_cache = {}  # Ordering -> [[group, [game ids]], ...], see SortIndex
+        self.game_cache_dirty = False  # Saved on exit instead of after every new ordering
+        self.sort_index = SortIndex()
+        self.library_fingerprint = ''
+        self.library_index = LibraryIndex(self.LIBRARY_FILE)  # Persistent listing of the games folders
+        self.library_folders = {}  # Games path -> game files, from the index first, then from the scan
+        self.library_scanner = None
+        self.library_refresh_timer = QTimer(self)  # Batches scan results into grid refreshes
+        self.library_refresh_timer.setSingleShot(True)
+        self.library_refresh_timer.setInterval(150)
+        self.library_refresh_timer.timeout.connect(self.refresh_library_grid)
+        self.library_scan_full = True
+        self.library_watcher = QFileSystemWatcher(self)  # Games and covers folders, see watch_library()
+        self.library_watcher.directoryChanged.connect(self.on_watched_directory_changed)
+        self.library_watch_pending = set()
+        self.library_watch_timer = QTimer(self)
+        self.library_watch_timer.setSingleShot(True)
+        self.library_watch_timer.setInterval(500)
+        self.library_watch_timer.timeout.connect(self.apply_watched_changes)
         
         # Image loading optimization
-        self.thread_pool = QThreadPool()
-        self.image_cache = ImageCache()
+        self.last_scroll_value = 0  # Prefetch follows the scroll direction
+        image_cache_mb = self.config.getint('MainWindow', 'image_cache_mb', fallback=128)
+        self.image_cache = ImageCache(max_bytes=image_cache_mb * 1024 * 1024)
+        thumbnail_cache_mb = self.config.getint('MainWindow', 'thumbnail_cache_mb', fallback=64)
+        self.thumbnail_cache = ThumbnailCache(max_bytes=thumbnail_cache_mb * 1024 * 1024)
+        threading.Thread(target=self.thumbnail_cache.prune, name="ThumbnailPrune", daemon=True).start()
+        decode_threads = self.config.getint('MainWindow', 'image_decode_threads', fallback=2)
+        self.decode_scheduler = DecodeScheduler(self.thumbnail_cache, max_threads=decode_threads)
+        self.decode_scheduler.decoded.connect(self.on_cover_loaded)
 
         self.init_ui()
         self._blocker = Blocker(self)
@@ -445,13 +833,11 @@ class MainWindow(QMainWindow):
         dropdown_button.setFont(QFont("Arial", self.centralWidget().width() // 40, QFont.Bold))
 
         dropdown_menu = QMenu(dropdown_button)
-        option1 = QAction("Alphabetical", self)
-        option2 = QAction("Emulator", self)
-        # Connect the actions to the update_sort_by_setting method
-        option1.triggered.connect(lambda: self.update_sort_by_setting("alphabetical"))
-        option2.triggered.connect(lambda: self.update_sort_by_setting("emulator"))
-        dropdown_menu.addAction(option1)
-        dropdown_menu.addAction(option2)
+        # One action per ordering, connected to the update_sort_by_setting method
+        for ordering in SORT_ORDERINGS:
+            option = QAction(ordering.replace('_', ' ').capitalize(), self)
+            option.triggered.connect(lambda _, o=ordering: self.update_sort_by_setting(o))
+            dropdown_menu.addAction(option)
         dropdown_menu.setStyleSheet("""
             QMenu {
                 background-color: rgba(15, 12, 41, 230);
@@ -604,10 +990,12 @@ class MainWindow(QMainWindow):
         self.grid_scroll_area = TouchScrollArea()  # Use the custom TouchScrollArea
         self.grid_scroll_area.setWidgetResizable(True)
         self.grid_scroll_area.setStyleSheet("background-color: transparent; border: none;")  # Set background color for scroll area
-        grid_widget = QWidget()
-        grid_widget.setStyleSheet("background-color: transparent;")  # Set background color for grid widget
-        self.grid_layout = QGridLayout(grid_widget)
-        self.grid_scroll_area.setWidget(grid_widget)
+        # Tiles are positioned by hand on this canvas, only for the visible rows
+        self.grid_canvas = GridCanvas()
+        self.grid_canvas.setStyleSheet("background-color: transparent;")  # Set background color for grid widget
+        self.grid_scroll_area.setWidget(self.grid_canvas)
+        self.grid_canvas.widthChanged.connect(self._relayout_visible_rows)
+        self.grid_scroll_area.verticalScrollBar().valueChanged.connect(self._update_visible_tiles)
 
         self.grid_scroll_area.screenTouched.connect(self.on_screen_touched)  # Connect the signal to the handler
 
@@ -721,7 +1109,7 @@ class MainWindow(QMainWindow):
         self.input_label.setStyleSheet("color: white;")
         settings_layout.addWidget(self.input_label)
 
-        self.vpad_checkbox = QCheckBox("Enable virtual controller (ViGEm)")
+        self.vpad_checkbox = QCheckBox("Enable virtual controller (ViGEm / uinput)")
         self.vpad_checkbox.setFont(QFont("Arial", 18))
         self.vpad_checkbox.setStyleSheet("color: white;")
         self.vpad_checkbox.setChecked(self.vpad_enabled)
@@ -847,21 +1235,16 @@ class MainWindow(QMainWindow):
         if self.fullscreen:
             self.showFullScreen()
 
-        games = self.get_games_names()
+        # Show the library as it was last indexed right away, the scan thread
+        # then checks every folder and streams the differences in
+        self.load_library_snapshot()
 
-        for game in games.get('list_games'):
-            self.add_game_to_grid(game)
-        
         self.games_loaded = True
         self.load_game_cache()
-        self.recalculate_grid_layout()
-
         self.recalculate_grid_layout()
         self.update_tab_indicator()
-        
-        # Show error popup if there were any initialization errors
-        if self.init_errors:
-            ErrorDialog(self.init_errors)
+
+        self.start_library_scan()
     
     def populate_any_controller_combo(self, combo: QComboBox):
         try:
@@ -958,11 +1341,11 @@ class MainWindow(QMainWindow):
         else:
             return ''
     
-    def get_games_names(self):
+    def get_library_sources(self):
+        """Return the games folders, emulator executables per folder, templates and excluded extensions."""
         excluded_extensions = []
-        games_names = []
         games_paths = []
-        emulators_games = {}
+        executables = {}
         templates = {}
 
         for key, value in self.config.items('MainWindow'):
@@ -971,7 +1354,8 @@ class MainWindow(QMainWindow):
                 break
             else:
                 excluded_extensions = [".bin",".sav",".txt","shortcuts",".sgm",".srm","backups"]
-
+        # a tuple so a single str.endswith() call checks every suffix, empty entries would match everything
+        excluded_extensions = tuple(ext for ext in excluded_extensions if ext)
 
         for key, value in self.config.items('Emulators'):
             # Check if this is an emulator executable path or a games directory path
@@ -980,63 +1364,203 @@ class MainWindow(QMainWindow):
                 games_paths.append(value)
             else:
                 # This is an emulator executable path
-                emulators_games[os.path.dirname(value)] = [value]
+                executables[os.path.dirname(value)] = value
 
         for key, value in self.config.items('Templates'):
             templates[key] = value
 
-        for game_path in games_paths:
-            try:
-                if not os.path.exists(game_path):
-                    error_msg = f"Path does not exist: {game_path}"
-                    print(error_msg)
-                    self.init_errors.append(error_msg)
-                    continue
-                
-                if not os.path.isdir(game_path):
-                    error_msg = f"Path is not a directory: {game_path}"
-                    print(error_msg)
-                    self.init_errors.append(error_msg)
-                    continue
-                
-                files = os.listdir(game_path)
-                files2 = []
-                for file in files:
-                    if not any(file.endswith(ext) for ext in excluded_extensions):
-                        if file in games_names:
-                            old_path = os.path.join(game_path, file)
-                            root, ext = os.path.splitext(file)
-                            id = self.emu_tag(game_path, k=3)
-                            new_name = f"{root}.{id}{ext}"
-                            new_path = os.path.join(game_path, new_name)
-                            # avoid collision if the target already exists
-                            i = 2
-                            while os.path.exists(new_path):
-                                new_name = f"{root}.{id}-{i}{ext}"
-                                new_path = os.path.join(game_path, new_name)
-                                i += 1
-                            os.rename(old_path, new_path)
-                            files2.append(new_name)
-                        else:
-                            files2.append(file)
-                emulators_games[os.path.dirname(game_path)] += files2
-
-                set_emu = self.set_emulator(emulators_games[os.path.dirname(game_path)][0].lower())
-                emulator_basename = os.path.basename(emulators_games[os.path.dirname(game_path)][0])
-                    
-                self.game_executables += [templates[set_emu].replace("exepath", emulators_games[os.path.dirname(game_path)][0]).replace("game", f'"{os.path.join(game_path, file)}"') for file in emulators_games[os.path.dirname(game_path)] if file != emulator_basename]
-                games_names += files2
-                
-                # Populate game_to_emulator map
-                for game in files2:
-                    self.game_to_emulator[game] = set_emu
-            except Exception as e:
-                error_msg = f"Error processing path '{game_path}': {str(e)}"
-                print(error_msg)
-                self.init_errors.append(error_msg)
+        return games_paths, executables, templates, excluded_extensions
+
+    def load_library_snapshot(self):
+        """
+        Fill the library from the folder listings stored in the library index.
+        Nothing is read from the games folders, so this is instant even for a
+        slow share; start_library_scan() brings it up to date.
+        """
+        self.library_paths, self.library_executables, self.library_templates, excluded_extensions = self.get_library_sources()
+        for game_path in self.library_paths:
+            entries = self.library_index.cached_entries(game_path)
+            if entries is None:
+                continue
+            self.library_folders[game_path] = [f for f in entries if not f.endswith(excluded_extensions)]
+        self.rebuild_library()
+
+    def start_library_scan(self, game_paths=None):
+        """Scan game_paths (every games folder by default) on a LibraryScanner thread."""
+        _, _, _, excluded_extensions = self.get_library_sources()
+        self.library_scanned = set()
+        self.library_scan_full = game_paths is None
+        self.library_scanner = LibraryScanner(self.library_paths if game_paths is None else game_paths,
+                                              excluded_extensions, self.library_index)
+        self.library_scanner.folder_scanned.connect(self.on_library_folder_scanned)
+        self.library_scanner.scan_error.connect(self.on_library_scan_error)
+        self.library_scanner.finished.connect(self.on_library_scan_finished)
+        self.library_scanner.start()
+
+    def stop_library_scan(self):
+        self.library_watch_timer.stop()
+        if self.library_scanner is not None:
+            self.library_scanner.requestInterruption()
+            self.library_scanner.wait()
+            self.library_scanner = None
+
+    def on_library_folder_scanned(self, game_path, files):
+        self.library_scanned.add(game_path)
+        if self.library_folders.get(game_path) != files:
+            self.library_folders[game_path] = files
+            # refresh at most every 150 ms while folders keep coming in
+            if not self.library_refresh_timer.isActive():
+                self.library_refresh_timer.start()
+
+    def on_library_scan_error(self, message):
+        print(message)
+        if self.library_scan_full:
+            self.init_errors.append(message)
+
+    def on_library_scan_finished(self):
+        if self.library_scanner is None or self.library_scanner.isInterruptionRequested():
+            return
+        scanned_paths = self.library_scanner.games_paths
+        self.library_scanner = None
+
+        changed = self.library_refresh_timer.isActive()
+        self.library_refresh_timer.stop()
+
+        # Folders that could not be scanned are not shown from the index either
+        for game_path in scanned_paths:
+            if game_path in self.library_folders and game_path not in self.library_scanned:
+                del self.library_folders[game_path]
+                changed = True
+
+        errors = self.refresh_library_grid() if changed else self.rebuild_library()
+
+        if self.library_scan_full:
+            self.library_index.prune(self.library_paths)
+            print(f"Library index: {self.library_index.hits} folder(s) from index, {self.library_index.misses} rescanned.")
+            self.watch_library()
+
+            # Show error popup if there were any initialization errors
+            self.init_errors += errors
+            if self.init_errors:
+                ErrorDialog(self.init_errors)
+
+        # Changes seen while this scan was running
+        if self.library_watch_pending:
+            self.library_watch_timer.start()
+
+    def watch_library(self):
+        """Watch the games folders and the covers folder, changes are applied without a reload."""
+        paths = [p for p in self.library_paths if os.path.isdir(p)]
+        if os.path.isdir(self.cover_index.directory):
+            paths.append(self.cover_index.directory)
+        watched = set(self.library_watcher.directories())
+        new_paths = [p for p in paths if p not in watched]
+        if new_paths:
+            self.library_watcher.addPaths(new_paths)
+
+    def on_watched_directory_changed(self, path):
+        # copying a ROM fires a burst of notifications, apply them together
+        self.library_watch_pending.add(path)
+        self.library_watch_timer.start()
+
+    def apply_watched_changes(self):
+        if self.library_scanner is not None:
+            return  # picked up again when the running scan finishes
+
+        paths = {os.path.normpath(p) for p in self.library_watch_pending}
+        self.library_watch_pending = set()
+        if os.path.normpath(self.cover_index.directory) in paths:
+            self.refresh_covers()
+
+        game_paths = [p for p in self.library_paths if os.path.normpath(p) in paths]
+        for game_path in game_paths:
+            # the watcher saw a change, do not trust an unchanged folder mtime
+            self.library_index.forget(game_path)
+        if game_paths:
+            self.start_library_scan(game_paths)
+
+    def refresh_covers(self):
+        """Rebuild the cover index and rebind only the tiles whose cover changed."""
+        self.cover_index.refresh(force=True)
+        self._forget_pooled_bindings()
+        if self.simplified_ui:
+            return
+        for button in list(self.visible_game_tiles()):
+            cover = self.find_background_image(button.game_name)
+            if cover != (button.cover_key[0] if button.cover_key else None):
+                self._bind_game_tile(button, button.game_name)
+
+    def rebuild_library(self):
+        """Rebuild game_names, game_records and game_to_emulator from library_folders, return the errors."""
+        errors = []
+        self.game_names = []
+        self.game_records = {}
+        self.game_to_emulator = {}
+
+        # Fingerprint of the library for games_cache.json: per folder its indexed
+        # mtime, game count, emulator and template, no need to hash every game
+        mtimes = self.library_index.directory_mtimes()
+        fingerprint = hashlib.md5()
+
+        for game_path in self.library_paths:
+            files = self.library_folders.get(game_path)
+            if files is None:
+                continue
+            executable = self.library_executables.get(os.path.dirname(game_path))
+            if executable is None:
+                errors.append(f"Error processing path '{game_path}': no emulator executable configured for this folder")
+                continue
+            set_emu = self.set_emulator(executable.lower())
+            if set_emu not in self.library_templates:
+                errors.append(f"Error processing path '{game_path}': no launch template for '{set_emu}'")
+                continue
+
+            emulator_basename = os.path.basename(executable)
+            template = self.library_templates[set_emu]
+            sizes = self.library_index.entry_sizes(game_path)
+            fingerprint.update(f"{game_path}\0{mtimes.get(game_path, -1)}\0{len(files)}\0{executable}\0{set_emu}\0{template}\n".encode())
+            for game in files:
+                rom_path = os.path.join(game_path, game)
+                command = render_command(template, executable, rom_path) if game != emulator_basename else ''
+                # A file name already used by an earlier folder is shown with the folder tag,
+                # the file itself keeps its name
+                name = game if game not in self.game_records else self.duplicate_display_name(game_path, game)
+                self.game_records[name] = GameRecord(name, set_emu, executable, rom_path, command, sizes.get(game, 0))
+                self.game_to_emulator[name] = set_emu
+                self.game_names.append(name)
+
+        self.sort_index = SortIndex(self.game_names)
+        self.library_fingerprint = fingerprint.hexdigest()
+        return errors
+
+    def duplicate_display_name(self, game_path, game):
+        """Name of the library entry for a file whose name is already taken, e.g. 'Game.abc.iso'."""
+        root, ext = os.path.splitext(game)
+        tag = self.emu_tag(game_path, k=3)
+        name = f"{root}.{tag}{ext}"
+        i = 2
+        while name in self.game_records:
+            name = f"{root}.{tag}-{i}{ext}"
+            i += 1
+        return name
+
+    def refresh_library_grid(self):
+        """Apply the folders scanned so far to the grid, return the library errors."""
+        errors = self.rebuild_library()
+        self.game_cache = {}  # sorted lists are stale
+        self.game_cache_dirty = True
+        self.recalculate_grid_layout()
+
+        # keep the selection inside the new grid
+        if self.selected_row >= len(self.games_in_grid):
+            self.selected_row = len(self.games_in_grid) - 1
+        if self.selected_row >= 0:
+            self.selected_col = max(0, min(self.selected_col, len(self.games_in_grid[self.selected_row]) - 1))
+        else:
+            self.selected_col = -1
+        self.highlight_selected_game()
+        return errors
 
-        return {'total_games':len(games_names), 'list_games':games_names}
-    
     def emu_tag(self, emulator_name, k=3):
         h = hashlib.sha1(emulator_name.lower().encode()).digest()
         return base64.b32encode(h).decode().lower().replace('=', '')[:k]
@@ -1186,8 +1710,7 @@ class MainWindow(QMainWindow):
         if not self.config.has_section(section):
             self.config.add_section(section)
         self.config.set(section, key, value)
-        with open('settings.ini', 'w') as configfile:
-            self.config.write(configfile)
+        self.settings_store.save()
 
     def style_button(self, button):
         button.setStyleSheet("""
@@ -1210,32 +1733,9 @@ class MainWindow(QMainWindow):
         button.setCursor(Qt.PointingHandCursor)
 
     def command_cleaner(self, command):
-        vcontroller = str(self.preferred_controller_idx)
-        if "?" in command:
-            commandsplt = command.split("?")
-            command = commandsplt[0]
-            scripts = commandsplt[1]
-
-            if "," in scripts:
-                scripts = scripts.split(",")
-            else:
-                scripts = [scripts]
-            
-            for script in scripts:
-                script = script.split("=")
-                self.run_command(f"{' '.join(script[0].split(':', 1))} {script[1].replace('emupath', os.path.dirname(command.split('"')[0])).replace('vcontroller',vcontroller)}", popup=False)
-                time.sleep(.5)
-        return command.replace("/","\\")
-
-    def run_command(self, command, popup:bool):
-        print("Running command: ", command)
-        worker = Worker(command)
-        worker.output_signal.connect(self.display_output)
-        worker.finished_signal.connect(lambda: self.worker_finished(worker))
-        worker.start()
-        self.active_workers.append(worker)  # Track active worker
-        if popup:
-            self.show_popup()
+        """Return the emulator command and the launch hooks (LaunchHook) to run before it."""
+        command, hooks = parse_launch_command(command, str(self.preferred_controller_idx))
+        return command.replace("/","\\"), hooks
 
     def setup_shortcuts(self):
         quit_shortcut = QShortcut(QKeySequence("Ctrl+Q"), self)
@@ -1252,7 +1752,18 @@ class MainWindow(QMainWindow):
         worker.deleteLater()
 
     def closeEvent(self, event):
+        if hasattr(self, "xinput_handler"):
+            self.xinput_handler.stop()
+
+        self.stop_library_scan()
+
+        if self.game_cache_dirty:
+            self.save_game_cache()
+
         if hasattr(self, "vpad") and self.vpad:
+            stats = self.vpad.stats()
+            print(f"Virtual pad: {stats['rate_hz']:.0f} Hz, {stats['frame_cost_us']:.0f} us/frame, "
+                  f"{stats['updates']} updates in {stats['frames']} frames")
             try:
                 self.vpad.stop()
             except Exception as e:
@@ -1263,51 +1774,50 @@ class MainWindow(QMainWindow):
                 worker.wait()
             except Exception as e:
                 print(f"Error waiting for worker: {e}")
+
+        if hasattr(self, "process_supervisor"):
+            self.process_supervisor.shutdown()  # emulators keep running
+
+        if hasattr(self, "library_index"):
+            self.library_index.close()
+
+        if hasattr(self, "state_store"):
+            self.state_store.close()
+
+        if hasattr(self, "settings_store"):
+            self.settings_store.close()
+
+        if hasattr(self, "decode_scheduler"):
+            self.decode_scheduler.shutdown()
+            stats = self.decode_scheduler.stats()
+            print(f"Cover decodes: {stats['threads']} threads, {stats['requests']} requests, "
+                  f"{stats['deduplicated']} already queued, {stats['cancelled']} cancelled")
+
+        if hasattr(self, "image_cache"):
+            stats = self.image_cache.stats()
+            print(f"Image cache: {stats['entries']} entries, {stats['resident_bytes'] / 1048576:.1f}/{stats['max_bytes'] / 1048576:.0f} MB, "
+                  f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
         # 3. Call parent closeEvent (lets Qt finish teardown)
         super().closeEvent(event)
 
         # 4. Explicit accept (optional, Qt usually does this itself if not ignored)
         event.accept()
 
-    def display_output(self, output):
-        print(output)
-
-    def add_game_to_grid(self, game_name):
-        self.game_names.append(game_name)  # Store game name
-
     def sort_games(self):
-        # Check cache first
-        if self.sort_by in self.game_cache:
-            return self.game_cache[self.sort_by]
-
-        sorted_games = {}
-        match self.sort_by:
-            case 'alphabetical':
-                for game in self.game_names:
-                    sorted_games[game[0].upper()] = sorted_games.get(game[0].upper(),[]) + [game]
-                sorted_games = {key: sorted_games[key] for key in sorted(sorted_games)}
-                
-            case 'emulator':
-                for game in self.game_names:
-                    emu = self.game_to_emulator.get(game, 'Unknown')
-                    sorted_games[emu] = sorted_games.get(emu,[]) + [game]
-                sorted_games = {key: sorted_games[key] for key in sorted(sorted_games)}
-            
-            case _:
-                for game in self.game_names:
-                    sorted_games[game[0].upper()] = sorted_games.get(game[0].upper(),[]) + [game]
-                sorted_games = {key: sorted_games[key] for key in sorted(sorted_games)}
-        
-        # Cache the result
-        self.game_cache[self.sort_by] = sorted_games
-        self.save_game_cache()
-        return sorted_games
+        """Return {group: [game names]} for the current ordering, built once per ordering."""
+        groups = self.game_cache.get(self.sort_by)
+        if groups is None:
+            file_sizes = {name: record.size for name, record in self.game_records.items()} if self.sort_by == 'file_size' else {}
+            groups = self.sort_index.build(self.sort_by, self.game_to_emulator, self.state_store.stats, file_sizes)
+            self.game_cache[self.sort_by] = groups
+            self.game_cache_dirty = True
+
+        names = self.sort_index.names
+        return {group: [names[i] for i in ids] for group, ids in groups}
 
     def get_games_fingerprint(self):
-        """Generate a fingerprint of the current game list and executables to validate cache."""
-        # Combine game names and executables to create a unique signature
-        data_to_hash = "".join(sorted(self.game_names)) + "".join(sorted(self.game_executables))
-        return hashlib.md5(data_to_hash.encode()).hexdigest()
+        """Fingerprint of the current library to validate the cache, computed by rebuild_library."""
+        return self.library_fingerprint
 
     def load_game_cache(self):
         """Load the game cache from disk if valid."""
@@ -1318,10 +1828,11 @@ class MainWindow(QMainWindow):
             with open(self.CACHE_FILE, 'r') as f:
                 data = json.load(f)
             
-            # Check fingerprint
+            # Check fingerprint, ids are positions in the stored name list
             current_fingerprint = self.get_games_fingerprint()
-            if data.get('fingerprint') == current_fingerprint:
-                self.game_cache = data.get('cache', {})
+            if data.get('fingerprint') == current_fingerprint and data.get('names') == self.sort_index.names:
+                cache = data.get('cache', {})
+                self.game_cache = {k: v for k, v in cache.items() if k not in UNCACHED_ORDERINGS}
                 print("Game cache loaded successfully.")
             else:
                 print("Game cache outdated. Rebuilding.")
@@ -1333,56 +1844,101 @@ class MainWindow(QMainWindow):
         try:
             data = {
                 'fingerprint': self.get_games_fingerprint(),
-                'cache': self.game_cache
+                'names': self.sort_index.names,
+                'cache': {k: v for k, v in self.game_cache.items() if k not in UNCACHED_ORDERINGS}
             }
             with open(self.CACHE_FILE, 'w') as f:
-                json.dump(data, f)
+                json.dump(data, f, separators=(',', ':'))
+            self.game_cache_dirty = False
         except Exception as e:
             print(f"Failed to save game cache: {e}")
 
-    def load_recents(self):
-        """Load recent games from JSON file. Returns empty list on failure/corruption."""
-        if not os.path.exists(self.RECENTS_FILE):
-            return []
-        
-        try:
-            with open(self.RECENTS_FILE, 'r') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-                return []
-        except Exception as e:
-            print(f"Error loading recents (resetting file): {e}")
-            return []
+    def record_play(self, game_name):
+        """Count a launch of game_name in the recents and the play stats."""
+        self.state_store.record_launch(game_name)
+        self.invalidate_play_orderings(('last_played', 'play_count'))
 
-    def save_recents(self, recents):
-        """Save recent games list to JSON file."""
-        try:
-            with open(self.RECENTS_FILE, 'w') as f:
-                json.dump(recents, f, indent=4)
-        except Exception as e:
-            print(f"Error saving recents: {e}")
+    def record_play_time(self, game_name, seconds):
+        """Add a finished session to the play time of game_name."""
+        self.state_store.add_play_time(game_name, seconds)
+        self.invalidate_play_orderings(('play_time',))
 
-    def update_recents(self, game_name):
-        """Update the recents list: add new game to top, remove duplicates, keep max 5."""
-        recents = self.load_recents()
-        
-        # Remove if already exists (to move it to top)
-        if game_name in recents:
-            recents.remove(game_name)
-            
-        # Add to top
-        recents.insert(0, game_name)
-        
-        # Keep only last n
-        recents = recents[:9]
-        
-        self.save_recents(recents)
+    def invalidate_play_orderings(self, orderings):
+        # Orderings that depend on the stats are built again when shown
+        for ordering in orderings:
+            if self.game_cache.pop(ordering, None) is not None:
+                self.game_cache_dirty = True
 
     def launch_game(self, game_name):
-        """Launch a game and update the recents list."""
-        self.update_recents(game_name)
-        self.run_command(self.command_cleaner(self.find_exec(game_name)), popup=True)
+        """Launch a game (its hooks first, off the GUI thread) and update the recents list."""
+        if self.pending_launch is not None:
+            print(f"Still launching {self.pending_launch}, ignoring the launch of {game_name}")
+            return
+        self.pending_launch = game_name
+        self.record_play(game_name)
+        requested = time.perf_counter()
+        command, hooks = self.command_cleaner(self.find_exec(game_name))
+        if not hooks:
+            self.start_emulator(game_name, command, requested, [])
+            return
+
+        worker = LaunchWorker(self.hook_runner, hooks)
+        worker.hooks_done.connect(lambda timings: self.start_emulator(game_name, command, requested, timings))
+        worker.finished.connect(lambda: self.worker_finished(worker))
+        self.active_workers.append(worker)
+        worker.start()
+
+    def start_emulator(self, game_name, command, requested, timings):
+        """Start the emulator once the hooks are done, record the launch timings and time the session."""
+        self.pending_launch = None
+        session = self.process_supervisor.launch(game_name, command)
+        if session is None:
+            return
+        self.last_launch_timings = timings + [('emulator start', time.perf_counter() - requested)]
+        stages = ", ".join(f"{label} {seconds * 1000:.0f} ms" for label, seconds in self.last_launch_timings)
+        print(f"Launch timings for {game_name}: {stages}")
+        self.show_popup()
+        self.enter_game_mode()
+
+    def on_game_session_finished(self, session):
+        print(f"{session.game_name} (pid {session.pid}) exited with {session.exit_code} after {session.runtime:.0f} s")
+        if session.exit_code:
+            for line in self.process_supervisor.tail(session.game_name):
+                print(line)
+        self.record_play_time(session.game_name, session.runtime)
+        if not self.process_supervisor.running:
+            self.exit_game_mode()
+
+    def enter_game_mode(self):
+        """
+        Give the machine to the game: stop reading controllers for the UI, drop
+        most decoded covers, hide the grid and, if enabled, lower the hub
+        priority. The virtual controller keeps running, the game uses it.
+        """
+        if self.game_mode:
+            return
+        self.game_mode = True
+        if hasattr(self, "xinput_handler"):
+            self.xinput_handler.suspend()
+        self.decode_scheduler.cancel_all()
+        self.image_cache.trim(self.GAME_MODE_CACHE_BYTES)
+        self.grid_scroll_area.hide()
+        if self.game_mode_low_priority:
+            set_low_priority(True)
+        print(f"Game mode on, {self.image_cache.resident_bytes / 1048576:.1f} MB of covers kept.")
+
+    def exit_game_mode(self):
+        """Undo enter_game_mode once the last running game exited."""
+        if not self.game_mode:
+            return
+        self.game_mode = False
+        if self.game_mode_low_priority:
+            set_low_priority(False)
+        self.grid_scroll_area.show()
+        if hasattr(self, "xinput_handler"):
+            self.xinput_handler.resume()
+        self._update_visible_tiles()
+        print("Game mode off.")
 
     def _find_tab_index_by_key(self, key: str) -> int:
         for idx, tab in enumerate(self.tabs):
@@ -1483,10 +2039,13 @@ class MainWindow(QMainWindow):
         if not self.games_loaded:
             return
 
+        # Build the row model only. games_in_grid holds the game names of every
+        # visual row, row_offsets the slots taken by a header and row_headers the
+        # header key of the rows that start a group. Widgets are only created for
+        # the rows inside the viewport (see _update_visible_tiles).
         self.games_in_grid = []
         self.row_offsets = []  # Track the offset (indentation) for each row
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().setParent(None)
+        self.row_headers = []
 
         sorted_games = self.sort_games()
         
@@ -1501,168 +2060,243 @@ class MainWindow(QMainWindow):
         
         # Handle recents mode
         elif self.current_grid == 'recents':
-            recent_games = self.load_recents()
+            recent_games = self.state_store.recents
             if recent_games:
                 # Create a single category for recents
                 sorted_games = {'recents': recent_games}
             else:
                 sorted_games = {}
         
-        current_letter = ""
-        row = -1  # Start with -1 so the first increment sets it to 0
-        col = 0
-        button_margin = 25  # Margin around each button
-        window_width = self.centralWidget().width()
-        button_size = (window_width // 5) - button_margin * 2
-        buttons_per_row = window_width // (button_size + button_margin * 2)
+        button_size, buttons_per_row = self._grid_metrics()
 
         for first_letter, game_names in sorted_games.items():
-            for game_name in game_names:
-                if first_letter != current_letter:
-                    col = 0
-                    row += 1
-                    self.grid_layout.addWidget(QHLine(), row, col, 1, 5)
-                    current_letter = first_letter
-                    
-                    # Create unified header box for both emulator and alphabetical sorting
-                    # is_icon=True for emulator sorting, False for alphabetical
-                    header_widget = self._create_header_box(
-                        current_letter, 
-                        button_size, 
-                        is_icon=(self.sort_by == 'emulator' or self.current_grid == 'recents')
-                    )
-                    
-                    # Add the header widget to the grid
-                    self.grid_layout.addWidget(header_widget, row, col, Qt.AlignCenter)
-                    
-                    col += 1
-                    self.games_in_grid.append([])  # Add new row for letter/emulator
-                    self.row_offsets.append(1)     # This row has an offset of 1 (label takes first slot)
+            if not game_names:
+                continue
+            # First row of a group: header takes the first slot
+            self.games_in_grid.append([])
+            self.row_offsets.append(1)
+            self.row_headers.append(first_letter)
+            col = 1
 
+            for game_name in game_names:
                 if col >= buttons_per_row:
                     col = 0
-                    row += 1
                     self.games_in_grid.append([])  # Add new row for new line of games
                     self.row_offsets.append(0)     # This row has no offset
+                    self.row_headers.append(None)
 
-                if col >= buttons_per_row:
-                    col = 0
-                    row += 1
-                    self.games_in_grid.append([])  # Add new row for new line of games
-
-                button = self._add_game_button(game_name, row, col)
-                self.games_in_grid[-1].append(button)  # Add button to the latest row in the grid
+                self.games_in_grid[-1].append(game_name)
                 col += 1
 
-        self.highlight_selected_game()
+        # A different size means the pooled tiles cannot be reused
+        if button_size != self.grid_tile_size:
+            self._clear_grid_tiles()
+            self.grid_tile_size = button_size
+        else:
+            self._release_grid_rows()
 
-    def find_exec(self, game_name):
-        for item in self.game_executables:
-            if game_name in item:
-                return item
-        return ''  # Return '' if no match is found
+        self.grid_canvas.setFixedHeight(self._grid_row_top(len(self.games_in_grid)) + self.GRID_MARGIN)
+        self._update_visible_tiles()
+        self.highlight_selected_game()
 
-    def _add_game_button(self, game_name, row, col):
+    def _grid_metrics(self):
+        """Return (button_size, buttons_per_row) for the current window width."""
         button_margin = 25  # Margin around each button
         window_width = self.centralWidget().width()
         button_size = (window_width // 5) - button_margin * 2
+        buttons_per_row = max(1, window_width // (button_size + button_margin * 2))
+        return button_size, buttons_per_row
+
+    def _grid_row_top(self, row):
+        return self.GRID_MARGIN + row * (self.grid_tile_size + self.GRID_SPACING)
+
+    def _grid_cell_rect(self, row, visual_col):
+        """Canvas geometry (x, y, size) of a tile centered in its grid cell."""
+        _, columns = self._grid_metrics()
+        width = self.grid_canvas.width() - 2 * self.GRID_MARGIN
+        cell_width = (width - (columns - 1) * self.GRID_SPACING) / columns
+        cell_x = self.GRID_MARGIN + visual_col * (cell_width + self.GRID_SPACING)
+        x = int(cell_x + (cell_width - self.grid_tile_size) / 2)
+        return x, self._grid_row_top(row), self.grid_tile_size
+
+    def _visible_row_range(self):
+        """First and last model rows intersecting the viewport, plus one row of slack."""
+        if not self.games_in_grid:
+            return 0, -1
+        pitch = self.grid_tile_size + self.GRID_SPACING
+        top = self.grid_scroll_area.verticalScrollBar().value()
+        bottom = top + self.grid_scroll_area.viewport().height()
+        first = max(0, (top - self.GRID_MARGIN) // pitch - 1)
+        last = min(len(self.games_in_grid) - 1, (bottom - self.GRID_MARGIN) // pitch + 1)
+        return first, last
+
+    def _update_visible_tiles(self, *_):
+        """Bind tiles to the rows entering the viewport and recycle the ones leaving it."""
+        if not self.games_loaded or self.grid_tile_size <= 0:
+            return
 
-        button = QPushButton()
-        button.setFixedSize(button_size, button_size)  # Set fixed size for the button
-        button.clicked.connect(lambda: self.launch_game(game_name))
-        
-        # Check for custom background image for this game (only if simplified UI is disabled)
-        game_bg_path = None if self.simplified_ui else self.find_background_image(game_name)
-        
-        # Create background image layer if image exists
-        if game_bg_path:
-            padding = 8
-            inner_size = button_size - (padding * 2)
-            
-            # Create a background label that covers the inner area
-            bg_label = QLabel(button)
-            bg_label.setGeometry(padding, padding, inner_size, inner_size)
-            bg_label.setScaledContents(True)
-            bg_label.lower()  # Send to back
+        first, last = self._visible_row_range()
+        for row in [r for r in self.grid_rows if r < first or r > last]:
+            self._release_grid_row(row)
+
+        for row in range(first, last + 1):
+            if row not in self.grid_rows:
+                self._materialize_grid_row(row)
+
+        self._schedule_cover_loads()
+
+    def _materialize_grid_row(self, row):
+        widgets = {'tiles': [], 'header': None, 'line': None}
+        offset = self.row_offsets[row]
+        header = self.row_headers[row]
+        size = self.grid_tile_size
+
+        if header is not None:
+            x, y, _ = self._grid_cell_rect(row, 0)
+            line = QHLine()
+            line.setParent(self.grid_canvas)
+            line.setGeometry(self.GRID_MARGIN, y + size // 2, self.grid_canvas.width() - 2 * self.GRID_MARGIN, 2)
+            line.show()
+            line.lower()
+
+            # Create unified header box for both emulator and alphabetical sorting
+            # is_icon=True for emulator sorting, False for alphabetical
+            header_widget = self._create_header_box(
+                header,
+                size,
+                is_icon=(self.sort_by in ('emulator', 'system_release') or self.current_grid == 'recents')
+            )
+            header_widget.setParent(self.grid_canvas)
+            box = header_widget.width()
+            header_widget.move(x + (size - box) // 2, y + (size - box) // 2)
+            header_widget.show()
+            widgets['line'] = line
+            widgets['header'] = header_widget
+
+        for col, game_name in enumerate(self.games_in_grid[row]):
+            button = self._take_grid_tile(game_name, size)
+            x, y, _ = self._grid_cell_rect(row, col + offset)
+            button.move(x, y)
+            button.grid_pos = (row, col)
+            if button.game_name == game_name:
+                # Same game as before the relayout, cover and logo are still right
+                self.update_button_favorite_indicator(button, self.clean_game_name(game_name))
+                self._apply_tile_highlight(button, (row, col) == (self.selected_row, self.selected_col))
+            else:
+                self._bind_game_tile(button, game_name)
+            button.show()
+            widgets['tiles'].append(button)
+
+        self.grid_rows[row] = widgets
+
+    def _take_grid_tile(self, game_name, size):
+        """A pooled tile, preferably one still bound to game_name, or a new one."""
+        button = self.grid_tile_pool_by_name.pop(game_name, None)
+        if button is not None:
+            self.grid_tile_pool.remove(button)
+            return button
+        if not self.grid_tile_pool:
+            return self._create_game_tile(size)
+        # oldest first, recently hidden tiles are the likeliest to come back
+        button = self.grid_tile_pool.pop(0)
+        if self.grid_tile_pool_by_name.get(button.game_name) is button:
+            del self.grid_tile_pool_by_name[button.game_name]
+        return button
 
-            # Check cache first
-            cache_key = (game_bg_path, inner_size)
-            cached_pixmap = self.image_cache.get(cache_key)
+    def _release_grid_row(self, row):
+        widgets = self.grid_rows.pop(row)
+        for button in widgets['tiles']:
+            button.hide()
+            # keep the binding, the same game may be laid out again
+            self.grid_tile_pool.append(button)
+            self.grid_tile_pool_by_name[button.game_name] = button
+        for key in ('header', 'line'):
+            if widgets[key] is not None:
+                widgets[key].deleteLater()
+
+    def _relayout_visible_rows(self):
+        """Cell positions depend on the canvas width (e.g. when the scrollbar shows up)."""
+        self._release_grid_rows()
+        self._update_visible_tiles()
+
+    def _release_grid_rows(self):
+        for row in list(self.grid_rows):
+            self._release_grid_row(row)
+
+    def _clear_grid_tiles(self):
+        self._release_grid_rows()
+        for button in self.grid_tile_pool:
+            button.deleteLater()
+        self.grid_tile_pool = []
+        self.grid_tile_pool_by_name = {}
+
+    def _forget_pooled_bindings(self):
+        """Force pooled tiles to be bound again, e.g. after the covers changed."""
+        for button in self.grid_tile_pool:
+            button.game_name = None
+            button.cover_key = None
+        self.grid_tile_pool_by_name = {}
+
+    def visible_game_tiles(self):
+        """Yield the game tiles currently bound to a row of the grid."""
+        for widgets in self.grid_rows.values():
+            yield from widgets['tiles']
 
-            if cached_pixmap:
-                bg_label.setPixmap(cached_pixmap)
-            else:
-                # Async load
-                loader = ImageLoader(game_bg_path, inner_size, mode='inner')
-                # We use a default arg for bg_label to capture it in the lambda closure correctly
-                loader.signals.result.connect(lambda p, l=bg_label, k=cache_key: self.on_image_loaded(p, l, k))
-                self.thread_pool.start(loader)
-            
-            # Apply rounded corner mask to the inner image
-            inner_path = QPainterPath()
-            inner_path.addRoundedRect(0, 0, inner_size, inner_size, 20, 20)
-            bg_label.setMask(QRegion(inner_path.toFillPolygon().toPolygon()))
-            
-            # Apply semi-transparent overlay for better text visibility (also inner)
-            overlay = QLabel(button)
-            overlay.setObjectName("overlay")  # Name it so we can find it later
-            overlay.setGeometry(padding, padding, inner_size, inner_size)
-            overlay.setStyleSheet("background-color: rgba(0, 0, 0, 0);") # Transparent by default
-            overlay.setMask(QRegion(inner_path.toFillPolygon().toPolygon()))
-            overlay.lower()
-            bg_label.lower()  # Make sure bg is behind overlay
-            
-            # Create selection border frame (initially hidden)
-            border_frame = QLabel(button)
-            border_frame.setObjectName("selection_border")
-            border_frame.setGeometry(0, 0, button_size, button_size)
-            border_frame.setStyleSheet("""
-                background-color: transparent;
-                border: 3px solid cyan;
-                border-radius: 20px;
-            """)
-            border_frame.hide()  # Initially hidden
-            border_frame.raise_()  # Bring to front
-            
-            # Store reference to overlay and border for selection highlighting
-            button.has_bg_image = True
-            button.overlay_widget = overlay
-            button.border_widget = border_frame
-            
-            # Style button with transparency
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(255, 255, 255, 10);
-                    color: white;
-                    border: 1px solid rgba(255, 255, 255, 30);
-                    padding: 10px;
-                    font-family: Arial;
-                    border-radius: 20px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 20);
-                }
-                QPushButton:pressed {
-                    background-color: rgba(255, 255, 255, 5);
-                }
-            """)
-            
-            # Apply rounded corner mask to the button itself
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, button_size, button_size, 20, 20)
-            button.setMask(QRegion(path.toFillPolygon().toPolygon()))
-        else:
-            # Use default styling
-            button.has_bg_image = False
-            self.style_button(button)
+    def find_exec(self, game_name):
+        record = self.game_records.get(game_name)
+        return record.command if record else ''  # Return '' if no match is found
 
+    def _create_game_tile(self, button_size):
+        """Build the widget tree of a game tile once; _bind_game_tile fills it for a game."""
+        button = QPushButton(self.grid_canvas)
+        button.setFixedSize(button_size, button_size)  # Set fixed size for the button
+        button.game_name = None
+        button.cover_key = None
+        button.grid_pos = (-1, -1)
+        button.clicked.connect(lambda _=False, b=button: b.game_name and self.launch_game(b.game_name))
+
+        padding = self.TILE_PADDING
+        inner_size = button_size - (padding * 2)
+        button.inner_size = inner_size
+
+        # Create a background label that covers the inner area
+        bg_label = QLabel(button)
+        bg_label.setGeometry(padding, padding, inner_size, inner_size)
+        bg_label.setScaledContents(True)
+
+        # Apply rounded corner mask to the inner image
+        inner_path = QPainterPath()
+        inner_path.addRoundedRect(0, 0, inner_size, inner_size, 20, 20)
+        bg_label.setMask(QRegion(inner_path.toFillPolygon().toPolygon()))
+        
+        # Apply semi-transparent overlay for better text visibility (also inner)
+        overlay = QLabel(button)
+        overlay.setObjectName("overlay")  # Name it so we can find it later
+        overlay.setGeometry(padding, padding, inner_size, inner_size)
+        overlay.setStyleSheet("background-color: rgba(0, 0, 0, 0);") # Transparent by default
+        overlay.setMask(QRegion(inner_path.toFillPolygon().toPolygon()))
+        overlay.lower()
+        bg_label.lower()  # Make sure bg is behind overlay
+        
+        # Create selection border frame (initially hidden)
+        border_frame = QLabel(button)
+        border_frame.setObjectName("selection_border")
+        border_frame.setGeometry(0, 0, button_size, button_size)
+        border_frame.setStyleSheet("""
+            background-color: transparent;
+            border: 3px solid cyan;
+            border-radius: 20px;
+        """)
+        border_frame.hide()  # Initially hidden
+        border_frame.raise_()  # Bring to front
+
+        # Apply rounded corner mask to the button itself
+        path = QPainterPath()
+        path.addRoundedRect(0, 0, button_size, button_size, 20, 20)
+        button.setMask(QRegion(path.toFillPolygon().toPolygon()))
 
         # Create a QLabel for the emulator logo
-        emu = self.set_emulator(self.find_exec(game_name).lower())
-        pixmap = QPixmap(f"./images/{emu}.png")
-        scaled_pixmap = pixmap.scaled(round(button_size/3), round(button_size/3), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        background_label = QLabel(emu, button)
-        background_label.setPixmap(scaled_pixmap)
+        background_label = QLabel(button)
         background_label.setAlignment(Qt.AlignCenter)
         background_label.setStyleSheet(f"""
             QLabel {{
@@ -1676,27 +2310,13 @@ class MainWindow(QMainWindow):
         """)
 
         # Create a container for the text to separate background from text shadow
-        cleaned_name = self.clean_game_name(game_name)
-        is_favorited = cleaned_name in self.favorite_games
-        
         text_container = QWidget(button)
-        if is_favorited:
-            # Blueish tint for favorited games
-            text_container.setStyleSheet("""
-                background-color: rgba(48, 96, 141, 127);
-                border-radius: 20px;
-            """)
-        else:
-            text_container.setStyleSheet("""
-                background-color: rgba(0, 0, 0, 100);
-                border-radius: 20px;
-            """)
         text_layout = QVBoxLayout(text_container)
         text_layout.setContentsMargins(0, 0, 0, 0)
         text_layout.setSpacing(0)
 
         # Create a QLabel to handle text wrapping for the main button text
-        label = QLabel(self.clean_game_name(game_name), text_container)
+        label = QLabel(text_container)
         label.setWordWrap(True)
         label.setAlignment(Qt.AlignCenter)
         
@@ -1725,26 +2345,140 @@ class MainWindow(QMainWindow):
         layout.addWidget(background_label)
         layout.addWidget(text_container)
         button.setLayout(layout)
-        
-        # Hide overlay elements by default if button has background image
-        if button.has_bg_image:
-            background_label.hide()
-            text_container.hide()
-        
-        # Store references for visibility toggling
+
+        # Store references for rebinding and visibility toggling
+        button.has_bg_image = False
+        button.bg_label = bg_label
+        button.overlay_widget = overlay
+        button.border_widget = border_frame
         button.emulator_label = background_label
         button.text_container = text_container
-
-        self.grid_layout.addWidget(button, row, col)
+        button.name_label = label
         return button
 
-    def on_image_loaded(self, pixmap, bg_label, cache_key):
-        try:
-            if pixmap:
-                bg_label.setPixmap(pixmap)
-                self.image_cache.put(cache_key, pixmap)
-        except RuntimeError:
-            pass # Widget deleted
+    def _bind_game_tile(self, button, game_name):
+        """Point a pooled tile at a game: cover, emulator logo, name and favorite tint."""
+        button.game_name = game_name
+        button_size = button.width()
+        inner_size = button.inner_size
+
+        # Check for custom background image for this game (only if simplified UI is disabled)
+        game_bg_path = None if self.simplified_ui else self.find_background_image(game_name)
+        button.has_bg_image = bool(game_bg_path)
+
+        if game_bg_path:
+            button.bg_label.show()
+            button.overlay_widget.show()
+
+            # Check cache first
+            cache_key = (game_bg_path, inner_size)
+            button.cover_key = cache_key
+            cached_pixmap = self.image_cache.get(cache_key)
+
+            if cached_pixmap:
+                button.bg_label.setPixmap(cached_pixmap)
+            else:
+                button.bg_label.clear()
+                # Async load, applied to whichever tile shows this cover when it is done
+                self.decode_scheduler.request(cache_key, self.COVER_PRIORITY_SLACK)
+            
+            # Style button with transparency
+            button.setStyleSheet("""
+                QPushButton {
+                    background-color: rgba(255, 255, 255, 10);
+                    color: white;
+                    border: 1px solid rgba(255, 255, 255, 30);
+                    padding: 10px;
+                    font-family: Arial;
+                    border-radius: 20px;
+                }
+                QPushButton:hover {
+                    background-color: rgba(255, 255, 255, 20);
+                }
+                QPushButton:pressed {
+                    background-color: rgba(255, 255, 255, 5);
+                }
+            """)
+        else:
+            # Use default styling
+            button.cover_key = None
+            button.bg_label.clear()
+            button.bg_label.hide()
+            button.overlay_widget.hide()
+            button.border_widget.hide()
+            self.style_button(button)
+
+        emu = self.game_to_emulator.get(game_name, '')
+        button.emulator_label.setPixmap(self._emulator_icon(emu, round(button_size/3)))
+
+        cleaned_name = self.clean_game_name(game_name)
+        button.name_label.setText(cleaned_name)
+        self.update_button_favorite_indicator(button, cleaned_name)
+
+        row, col = button.grid_pos
+        self._apply_tile_highlight(button, (row, col) == (self.selected_row, self.selected_col))
+
+    def _emulator_icon(self, emu, size):
+        key = (emu, size)
+        pixmap = self.emulator_icon_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(f"./images/{emu}.png")
+            pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self.emulator_icon_cache[key] = pixmap
+        return pixmap
+
+    def _schedule_cover_loads(self):
+        """
+        Queue the covers of the viewport first, then of the slack rows around it
+        and one screen ahead in the scroll direction; queued loads of covers
+        that are no longer wanted (scrolled away, re-layout) are cancelled.
+        """
+        if self.simplified_ui or self.game_mode or not self.games_in_grid:
+            self.decode_scheduler.cancel_all()
+            return
+
+        pitch = self.grid_tile_size + self.GRID_SPACING
+        top = self.grid_scroll_area.verticalScrollBar().value()
+        height = self.grid_scroll_area.viewport().height()
+        screen_rows = max(1, height // pitch + 1)
+        first_visible = max(0, (top - self.GRID_MARGIN) // pitch)
+        last_visible = (top + height - self.GRID_MARGIN) // pitch
+        first, last = self._visible_row_range()
+
+        scrolling_up = top < self.last_scroll_value
+        self.last_scroll_value = top
+        if scrolling_up:
+            prefetch = range(max(0, first - screen_rows), first)
+        else:
+            prefetch = range(last + 1, min(len(self.games_in_grid), last + 1 + screen_rows))
+
+        wanted = {}
+        for row in range(first, last + 1):
+            priority = self.COVER_PRIORITY_VISIBLE if first_visible <= row <= last_visible else self.COVER_PRIORITY_SLACK
+            for button in self.grid_rows.get(row, {}).get('tiles', ()):
+                if button.cover_key and button.cover_key not in self.image_cache.cache:
+                    wanted[button.cover_key] = priority
+
+        inner_size = self.grid_tile_size - 2 * self.TILE_PADDING
+        for row in prefetch:
+            for game_name in self.games_in_grid[row]:
+                path = self.find_background_image(game_name)
+                if path and (path, inner_size) not in wanted and (path, inner_size) not in self.image_cache.cache:
+                    wanted[(path, inner_size)] = self.COVER_PRIORITY_PREFETCH
+
+        self.decode_scheduler.new_generation()
+        for cache_key, priority in wanted.items():
+            self.decode_scheduler.request(cache_key, priority)
+        self.decode_scheduler.cancel_stale()
+
+    def on_cover_loaded(self, cache_key, pixmap):
+        """A decode finished, apply it to every visible tile showing that cover."""
+        if not pixmap:
+            return
+        self.image_cache.put(cache_key, pixmap)
+        for button in self.visible_game_tiles():
+            if button.cover_key == cache_key:
+                button.bg_label.setPixmap(pixmap)
 
     def resizeEvent(self, event):
         self.recalculate_grid_layout()
@@ -1780,51 +2514,53 @@ class MainWindow(QMainWindow):
         """
         if not self.games_in_grid:
             return  # If there are no games in the grid, do nothing
-        
-        for row in range(len(self.games_in_grid)):
-            for col in range(len(self.games_in_grid[row])):
-                button = self.games_in_grid[row][col]
-                is_selected = (row, col) == (self.selected_row, self.selected_col)
+
+        # Ensure the selected game is visible within the scroll area first, so the
+        # tiles of the rows scrolled into view get bound before styling
+        if not self.screen_touched and 0 <= self.selected_row < len(self.games_in_grid):
+            x, y, size = self._grid_cell_rect(self.selected_row, self.selected_col + self.row_offsets[self.selected_row])
+            self.grid_scroll_area.ensureVisible(x + size // 2, y + size // 2, size // 2 + 50, size // 2 + 50)
+
+        for button in self.visible_game_tiles():
+            self._apply_tile_highlight(button, button.grid_pos == (self.selected_row, self.selected_col))
+
+    def _apply_tile_highlight(self, button, is_selected):
+        if button.has_bg_image:
+            # Determine if overlay should be shown
+            # Show if global toggle is on OR (selected AND not touched)
+            should_show_overlay = self.show_all_overlays or (is_selected and not self.screen_touched)
+            
+            if should_show_overlay:
+                button.overlay_widget.setStyleSheet("background-color: rgba(0, 0, 0, 100);")
+                button.emulator_label.show()
+                button.text_container.show()
+            else:
+                button.overlay_widget.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+                button.emulator_label.hide()
+                button.text_container.hide()
                 
-                if hasattr(button, 'has_bg_image') and button.has_bg_image:
-                    # Determine if overlay should be shown
-                    # Show if global toggle is on OR (selected AND not touched)
-                    should_show_overlay = self.show_all_overlays or (is_selected and not self.screen_touched)
-                    
-                    if should_show_overlay:
-                        button.overlay_widget.setStyleSheet("background-color: rgba(0, 0, 0, 100);")
-                        if hasattr(button, 'emulator_label'): button.emulator_label.show()
-                        if hasattr(button, 'text_container'): button.text_container.show()
-                    else:
-                        button.overlay_widget.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
-                        if hasattr(button, 'emulator_label'): button.emulator_label.hide()
-                        if hasattr(button, 'text_container'): button.text_container.hide()
-                        
-                    # Selection border (only if selected and not touched)
-                    if is_selected and not self.screen_touched:
-                        button.border_widget.show()
-                    else:
-                        button.border_widget.hide()
-                else:
-                    # Default button styling
-                    if is_selected and not self.screen_touched:
-                        button.setStyleSheet("""
-                            QPushButton {
-                                background-color: transparent;
-                                color: cyan;
-                                border: 3px solid cyan;
-                                padding: 10px;
-                                font-family: Arial;
-                                border-radius: 20px;
-                            }
-                        """)
-                    else:
-                        self.style_button(button)
-
-        # Ensure the selected game button is visible within the scroll area
-        if not self.screen_touched and self.selected_row != -1:
-            selected_button = self.games_in_grid[self.selected_row][self.selected_col]
-            self.grid_scroll_area.ensureWidgetVisible(selected_button)
+            # Selection border (only if selected and not touched)
+            if is_selected and not self.screen_touched:
+                button.border_widget.show()
+            else:
+                button.border_widget.hide()
+        else:
+            button.emulator_label.show()
+            button.text_container.show()
+            # Default button styling
+            if is_selected and not self.screen_touched:
+                button.setStyleSheet("""
+                    QPushButton {
+                        background-color: transparent;
+                        color: cyan;
+                        border: 3px solid cyan;
+                        padding: 10px;
+                        font-family: Arial;
+                        border-radius: 20px;
+                    }
+                """)
+            else:
+                self.style_button(button)
 
     def setFrozen(self, freeze: bool):
         if freeze:
@@ -1902,9 +2638,10 @@ class MainWindow(QMainWindow):
         if self.stacked_widget.currentWidget() != self.stacked_widget.widget(0):
             return
 
-        selected_button = self.games_in_grid[self.selected_row][self.selected_col]
-        if isinstance(selected_button, QPushButton):
-            selected_button.click()
+        if not self.games_in_grid or self.selected_row == -1:
+            return
+
+        self.launch_game(self.games_in_grid[self.selected_row][self.selected_col])
 
     def handle_button_x(self):
         if self.stacked_widget.currentWidget() != self.stacked_widget.widget(0):
@@ -1923,7 +2660,7 @@ class MainWindow(QMainWindow):
 
         # stop generating new UI inputs
         try:
-            self.xinput_handler.timer.stop()
+            self.xinput_handler.stop()
         except Exception:
             pass
 
@@ -1946,10 +2683,9 @@ class MainWindow(QMainWindow):
         if self.stacked_widget.currentWidget() != self.stacked_widget.widget(0):
             return
 
-        if self.sort_by == 'alphabetical':
-            self.update_sort_by_setting('emulator')
-        else:
-            self.update_sort_by_setting('alphabetical')
+        # Cycle through the orderings of the "Order by" menu
+        index = SORT_ORDERINGS.index(self.sort_by) if self.sort_by in SORT_ORDERINGS else -1
+        self.update_sort_by_setting(SORT_ORDERINGS[(index + 1) % len(SORT_ORDERINGS)])
 
         # Do NOT reset selection or force controller mode here
         # The update_sort_by_setting will handle resetting to "no selection"
@@ -1995,7 +2731,8 @@ class MainWindow(QMainWindow):
             self.toggle_grid_view(tab='main')
 
     def init_xinput_handler(self):
-        self.xinput_handler = XInputHandler(self.settings_label, self.buttons_label, self, ignore_indices=self.ignored_xinput_indices)
+        poll_hz = self.config.getint('MainWindow', 'input_poll_hz', fallback=250)
+        self.xinput_handler = XInputHandler(self.settings_label, self.buttons_label, self, ignore_indices=self.ignored_xinput_indices, poll_hz=poll_hz)
         self.xinput_handler.dpad_signal.connect(self.handle_dpad_input)
         self.xinput_handler.button_a_signal.connect(self.handle_button_a)
         self.xinput_handler.button_b_signal.connect(self.handle_button_b)
@@ -2034,143 +2771,29 @@ class MainWindow(QMainWindow):
         cleaned_name = ' '.join(cleaned_name.split())
         return cleaned_name
 
-    @lru_cache(maxsize=1024)
     def find_background_image(self, game_name):
         """
         Finds the best matching background image for a given game name.
         Prioritizes:
         1. Exact match of cleaned name (removed region codes etc.)
-        2. Franchise match (longest prefix match)
+        2. Franchise match (longest cover name contained in the game name)
+        See CoverIndex for the lookup structures.
         """
-        # 1. Clean the game name
-        cleaned_name = self.clean_game_name(game_name)
-        
-        games_img_dir = "./images/games/"
-        if not os.path.exists(games_img_dir):
-            return None
-
-        # Get list of available images (cached)
-        if self.available_game_images is None:
-            try:
-                self.available_game_images = os.listdir(games_img_dir)
-            except OSError:
-                self.available_game_images = []
-                return None
-        
-        available_images = self.available_game_images
-
-        # 2. Check for exact match of cleaned name
-
-        # 2. Check for exact match of cleaned name
-        for ext in ['.png', '.jpg', '.jpeg', '.webp']:
-            candidate = f"{cleaned_name}{ext}"
-            # Case insensitive check would be better but for now let's stick to simple check or listdir check
-            # To be safe on case-sensitive FS (though Windows is usually not), let's iterate
-            for img in available_images:
-                if img.lower() == candidate.lower():
-                    return os.path.join(games_img_dir, img)
-        
-        # 2.5. Check for match with hyphens removed (substring match for games with subtitles)
-        # This allows "need for speed - carbon - own the city" to match "need for speed carbon.jpg"
-        cleaned_name_no_hyphens = ' '.join(cleaned_name.replace("-", " ").split()).lower()
-        best_hyphen_match = None
-        best_hyphen_match_len = 0
-        
-        for img in available_images:
-            img_root, img_ext = os.path.splitext(img)
-            if img_ext.lower() not in ['.png', '.jpg', '.jpeg', '.webp']:
-                continue
-            img_root_no_hyphens = ' '.join(img_root.replace("-", " ").split()).lower()
-            
-            # Check if image name is contained in game name (whole word match)
-            # We want the longest match to avoid matching "need for speed" when "need for speed carbon" exists
-            if img_root_no_hyphens in cleaned_name_no_hyphens:
-                if len(img_root_no_hyphens) > best_hyphen_match_len:
-                    best_hyphen_match = img
-                    best_hyphen_match_len = len(img_root_no_hyphens)
-        
-        if best_hyphen_match:
-            return os.path.join(games_img_dir, best_hyphen_match)
+        return self.cover_index.lookup(self.clean_game_name(game_name))
 
-        # 3. Franchise/Regex match
-        # Find longest image name that is contained in the cleaned game name (whole word)
-        best_match = None
-        best_match_len = 0
-        
-        cleaned_name_lower = cleaned_name.lower()
-        
-        for image in available_images:
-            if not any(image.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.webp']):
-                continue
-                
-            img_root, _ = os.path.splitext(image)
-            img_root_lower = img_root.lower()
-            
-            # Escape the image root to use in regex
-            # We use \b to ensure we match whole words (e.g. "Zelda" in "The Legend of Zelda")
-            # but avoid partial matches like "Man" in "Spider-Man" if we only had "Man.png" (unless that's desired, but \b helps)
-            pattern = r'\b' + re.escape(img_root_lower) + r'\b'
-            
-            if re.search(pattern, cleaned_name_lower):
-                # We want the longest match
-                if len(img_root) > best_match_len:
-                    best_match = image
-                    best_match_len = len(img_root)
-        
-        if best_match:
-            return os.path.join(games_img_dir, best_match)
-            
-        return None
-
-    def load_favorites(self):
-        """Load favorite games from settings.ini"""
-        if self.config.has_section('FavoriteGames'):
-            # We stored the actual game name as the value
-            self.favorite_games = set()
-            for key in self.config.options('FavoriteGames'):
-                game_name = self.config.get('FavoriteGames', key)
-                self.favorite_games.add(game_name)
-        else:
-            self.favorite_games = set()
-    
-    def save_favorites(self):
-        """Save favorite games to settings.ini"""
-        if not self.config.has_section('FavoriteGames'):
-            self.config.add_section('FavoriteGames')
-        
-        # Clear existing favorites
-        for option in self.config.options('FavoriteGames'):
-            self.config.remove_option('FavoriteGames', option)
-        
-        # Add current favorites
-        # Key: safe string (lower, underscores), Value: actual cleaned game name
-        for game_name in self.favorite_games:
-            safe_key = game_name.lower().replace(' ', '_').replace(':', '').replace('/', '')
-            self.config.set('FavoriteGames', safe_key, game_name)
-        
-        with open('settings.ini', 'w') as configfile:
-            self.config.write(configfile)
-    
     def toggle_favorite(self):
         """Toggle favorite status for currently selected game"""
-        if not self.games_in_grid:
+        if not self.games_in_grid or self.selected_row == -1:
             return
         
-        selected_button = self.games_in_grid[self.selected_row][self.selected_col]
-        # Get game name from button text
-        if hasattr(selected_button, 'text_container'):
-            game_name = selected_button.text_container.findChild(QLabel).text()
-        else:
-            return
+        # Favorites are stored by their displayed (cleaned) name
+        game_name = self.clean_game_name(self.games_in_grid[self.selected_row][self.selected_col])
         
         # Toggle favorite status
-        if game_name in self.favorite_games:
-            self.favorite_games.remove(game_name)
-        else:
-            self.favorite_games.add(game_name)
-        
-        self.save_favorites()
-        self.update_button_favorite_indicator(selected_button, game_name)
+        self.state_store.set_favorite(game_name, game_name not in self.favorite_games)
+        for button in self.visible_game_tiles():
+            if button.grid_pos == (self.selected_row, self.selected_col):
+                self.update_button_favorite_indicator(button, game_name)
     
     def update_button_favorite_indicator(self, button, game_name):
         """Update visual indicator for favorite status"""
@@ -2230,6 +2853,15 @@ class MainWindow(QMainWindow):
         self.grid_scroll_area.verticalScrollBar().setValue(0)
 
     def restart(self):
+        # Reload is the explicit way to pick up new ROMs, so rescan every folder
+        # (some filesystems, e.g. FAT on USB drives, do not update folder mtimes)
+        self.stop_library_scan()
+        if self.game_cache_dirty:
+            self.save_game_cache()
+        self.library_index.clear()
+        self.library_index.close()
+        self.state_store.close()
+        self.settings_store.close()
         QApplication.quit()  # Close the current instance of the application
         os.execl(sys.executable, sys.executable, *sys.argv)  # Restart the application
 
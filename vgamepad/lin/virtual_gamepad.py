@@ -3,16 +3,65 @@ VGamepad API (Linux)
 """
 from abc import ABC, abstractmethod
 from time import sleep
+import ctypes
+import os
 
 import libevdev
 import vgamepad.win.vigem_commons as vcom
 
 
+class _InputEvent(ctypes.Structure):
+    """
+    struct input_event from linux/input.h (the kernel fills in the timestamp)
+    """
+    _fields_ = [('tv_sec', ctypes.c_long),
+                ('tv_usec', ctypes.c_long),
+                ('type', ctypes.c_ushort),
+                ('code', ctypes.c_ushort),
+                ('value', ctypes.c_int)]
+
+
 class VGamepad(ABC):
 
     def __init__(self):
         self.device = libevdev.Device()
         self.device.name = 'Virtual Gamepad'
+        self.uinput_file = None
+        self._last_values = None
+
+    def _create_uinput_device(self):
+        """
+        Creates the uinput device on a /dev/uinput handle we own, so that a whole
+        report can be written with a single write() (see _send_changed)
+        """
+        try:
+            self.uinput_file = open('/dev/uinput', 'r+b', buffering=0)
+        except OSError:
+            self.uinput_file = None  # let libevdev locate and manage the uinput node
+        return self.device.create_uinput_device(self.uinput_file)
+
+    def _send_changed(self, values):
+        """
+        Sends the events whose value differs from the last sent report, followed by one SYN_REPORT
+
+        :param: list of values, aligned with self.event_codes
+        """
+        last = self._last_values or [None] * len(values)
+        changed = [(code, value) for code, value, old in zip(self.event_codes, values, last) if value != old]
+        if not changed:
+            return
+        self._last_values = values
+        changed.append((libevdev.EV_SYN.SYN_REPORT, 0))
+
+        if self.uinput_file is not None:
+            events = (_InputEvent * len(changed))()
+            for ev, (code, value) in zip(events, changed):
+                ev.type = code.type.value
+                ev.code = code.value
+                ev.value = value
+            os.write(self.uinput_file.fileno(), events)
+        else:
+            self.uinput.send_events([libevdev.InputEvent(code, value=value) for code, value in changed])
 
     def get_vid(self):
         """
@@ -117,7 +166,15 @@ class VX360Gamepad(VGamepad):
         self.device.enable(libevdev.EV_ABS.ABS_HAT0X, libevdev.InputAbsInfo(minimum=-1, maximum=1))
         self.device.enable(libevdev.EV_ABS.ABS_HAT0Y, libevdev.InputAbsInfo(minimum=-1, maximum=1))
 
-        self.uinput = self.device.create_uinput_device()
+        self.uinput = self._create_uinput_device()
+
+        # order of the values built by update()
+        self.event_codes = list(self.XUSB_BUTTON_TO_EV_KEY.values()) + [
+            libevdev.EV_ABS.ABS_X, libevdev.EV_ABS.ABS_Y,
+            libevdev.EV_ABS.ABS_RX, libevdev.EV_ABS.ABS_RY,
+            libevdev.EV_ABS.ABS_Z, libevdev.EV_ABS.ABS_RZ,
+            libevdev.EV_ABS.ABS_HAT0X, libevdev.EV_ABS.ABS_HAT0Y,
+        ]
 
         self.report = self.get_default_report()
         self.update()
@@ -242,39 +299,21 @@ class VX360Gamepad(VGamepad):
         """
         Sends the current report (i.e. commands) to the virtual device
         """
-        # Update buttons
-        for btn, key in self.XUSB_BUTTON_TO_EV_KEY.items():
-            self.uinput.send_events([
-                libevdev.InputEvent(key, value=(int(bool(self.report.wButtons & btn)))),
-            ])
-
-        # Update axes
-        self.uinput.send_events([
+        report = self.report
+        buttons = report.wButtons
+        values = [int(bool(buttons & btn)) for btn in self.XUSB_BUTTON_TO_EV_KEY]
+        values += [
             # Left joystick
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_X, value=self.report.sThumbLX),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_Y, value=self.report.sThumbLY),
+            report.sThumbLX, report.sThumbLY,
             # Right joystick
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_RX, value=self.report.sThumbRX),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_RY, value=self.report.sThumbRY),
+            report.sThumbRX, report.sThumbRY,
             # Triggers
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_Z, value=self.report.bLeftTrigger * 4),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_RZ, value=self.report.bRightTrigger * 4)
-        ])
-
-        hat0x_value = bool(self.report.wButtons
-                           & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT) - bool(
-                               self.report.wButtons
-                               & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT)
-        hat0y_value = bool(self.report.wButtons
-                           & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN) - bool(
-                               self.report.wButtons
-                               & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP)
-        self.uinput.send_events([
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_HAT0X, value=hat0x_value),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_HAT0Y, value=hat0y_value)
-        ])
-
-        self.uinput.send_events([libevdev.InputEvent(libevdev.EV_SYN.SYN_REPORT, value=0)])
+            (report.bLeftTrigger & 0xFF) * 4, (report.bRightTrigger & 0xFF) * 4,
+            # D-Pad
+            bool(buttons & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT) - bool(buttons & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT),
+            bool(buttons & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN) - bool(buttons & vcom.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP),
+        ]
+        self._send_changed(values)
 
     def target_alloc(self):
         return self.uinput
@@ -354,7 +393,15 @@ class VDS4Gamepad(VGamepad):
         self.device.enable(libevdev.EV_ABS.ABS_Z, libevdev.InputAbsInfo(minimum=0, maximum=255))
         self.device.enable(libevdev.EV_ABS.ABS_RZ, libevdev.InputAbsInfo(minimum=0, maximum=255))
 
-        self.uinput = self.device.create_uinput_device()
+        self.uinput = self._create_uinput_device()
+
+        # order of the values built by update()
+        self.event_codes = list(self.DS4_BUTTON_TO_EV_KEY.values()) + list(self.DS4_SPECIAL_BUTTON_TO_EV_KEY.values()) + [
+            libevdev.EV_ABS.ABS_X, libevdev.EV_ABS.ABS_Y,
+            libevdev.EV_ABS.ABS_RX, libevdev.EV_ABS.ABS_RY,
+            libevdev.EV_ABS.ABS_Z, libevdev.EV_ABS.ABS_RZ,
+            libevdev.EV_ABS.ABS_HAT0X, libevdev.EV_ABS.ABS_HAT0Y,
+        ]
 
         self.report = self.get_default_report()
         self.update()
@@ -496,37 +543,19 @@ class VDS4Gamepad(VGamepad):
         """
         Sends the current report (i.e. commands) to the virtual device
         """
-        for btn, key in self.DS4_BUTTON_TO_EV_KEY.items():
-            self.uinput.send_events([
-                libevdev.InputEvent(key, value=(int(bool(self.report.wButtons & btn)))),
-            ])
-
-        for btn, key in self.DS4_SPECIAL_BUTTON_TO_EV_KEY.items():
-            self.uinput.send_events([
-                libevdev.InputEvent(key, value=(int(bool(self.report.bSpecial & btn)))),
-            ])
-
-        # Update axes
-        self.uinput.send_events([
+        report = self.report
+        values = [int(bool(report.wButtons & btn)) for btn in self.DS4_BUTTON_TO_EV_KEY]
+        values += [int(bool(report.bSpecial & btn)) for btn in self.DS4_SPECIAL_BUTTON_TO_EV_KEY]
+        values += [
             # Left joystick
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_X, value=self.report.bThumbLX),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_Y, value=self.report.bThumbLY),
+            report.bThumbLX, report.bThumbLY,
             # Right joystick
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_RX, value=self.report.bThumbRX),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_RY, value=self.report.bThumbRY),
+            report.bThumbRX, report.bThumbRY,
             # Triggers
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_Z, value=self.report.bTriggerL),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_RZ, value=self.report.bTriggerR)
-        ])
-
-        hat0x_value, hat0y_value = self.dpad_mapping[self.dpad_direction]
-
-        self.uinput.send_events([
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_HAT0X, value=hat0x_value),
-            libevdev.InputEvent(libevdev.EV_ABS.ABS_HAT0Y, value=hat0y_value)
-        ])
-
-        self.uinput.send_events([libevdev.InputEvent(libevdev.EV_SYN.SYN_REPORT, value=0)])
+            report.bTriggerL, report.bTriggerR,
+        ]
+        values += self.dpad_mapping[self.dpad_direction]
+        self._send_changed(values)
 
     def target_alloc(self):
         return self.uinput
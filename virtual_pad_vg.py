@@ -1,7 +1,5 @@
 import os, sys, time, threading, ctypes
 from ctypes import wintypes
-import os, sys, time, threading, ctypes
-from ctypes import wintypes
 
 # Ensure vendored vgamepad is importable
 _here = os.path.dirname(os.path.abspath(__file__))
@@ -58,171 +56,239 @@ if sys.platform == 'win32':
         XInputGetState = None
         XInputSetState = None
 
-    # ---- Merger -> one virtual X360 ----
-    class VirtualX360:
-        def __init__(self, poll_hz=250, idle_hold_ms=500, deadzone=6000, trigger_deadzone=5):
-            self.poll_dt = 1.0 / float(poll_hz)
-            self.idle_hold = idle_hold_ms / 1000.0
-            self.deadzone = int(deadzone)
-            self.trig_dz = int(trigger_deadzone)
-            self._thread = None
-            self._stop = threading.Event()
-            self._owner = -1
-            self._last_activity = 0.0
-            self.gamepad = None  # vgamepad.VX360Gamepad
+elif sys.platform.startswith('linux'):
+    try:
+        import vgamepad as vg  # vendored, drives uinput through libevdev
+    except (ImportError, OSError):
+        vg = None
 
-        def start(self):
-            if vg is None:
-                print("vgamepad not loaded, cannot start VirtualX360")
-                return
+    # ---- evdev (physical devices), exposed with the XInput API ----
+    from xinput_utils import XINPUT_STATE, XInputGetState, ERROR_SUCCESS, evdev_pads
+    if evdev_pads() is None:
+        XInputGetState = None
+    XInputSetState = None  # no rumble passthrough on Linux
 
-            # vgamepad constructs and auto-connects a virtual X360 via ViGEmBus
-            try:
-                self.gamepad = vg.VX360Gamepad()
-            except Exception as e:
-                print(f"Failed to create VX360Gamepad: {e}")
-                return
-
-            # optional: rumble passthrough to active physical pad
-            def on_feedback(client, target, large, small, led, user_data):
-                idx = self._owner
-                if idx >= 0 and XInputSetState:
-                    vib = XINPUT_VIBRATION(
-                        wLeftMotorSpeed  = int(large) * 257,  # 0..255 -> 0..65535
-                        wRightMotorSpeed = int(small) * 257,
-                    )
-                    XInputSetState(idx, ctypes.byref(vib))
+else:
+    vg = None
+    XInputGetState = None
+    XInputSetState = None
+
+# XInput buttons the virtual pad forwards, XUSB uses the same bits (no GUIDE)
+XUSB_BUTTON_MASK = 0xF3FF
+
+# ---- Merger -> one virtual X360 ----
+class VirtualX360:
+    """
+    Merges the physical pads into one virtual X360 pad.
+
+    The merger loop runs at poll_hz while input is changing and, once no
+    dwPacketNumber moved for idle_after_ms, halves its rate every frame down
+    to idle_hz. Empty slots are only probed every empty_slot_interval seconds.
+    """
+    def __init__(self, poll_hz=250, idle_hold_ms=500, deadzone=6000, trigger_deadzone=5,
+                 idle_hz=20, idle_after_ms=1000, empty_slot_interval=1.0):
+        self.poll_dt = 1.0 / float(poll_hz)
+        self.idle_dt = 1.0 / float(idle_hz)
+        self.idle_after = idle_after_ms / 1000.0
+        self.empty_slot_interval = empty_slot_interval
+        self.idle_hold = idle_hold_ms / 1000.0
+        self.deadzone = int(deadzone)
+        self.trig_dz = int(trigger_deadzone)
+        # deadzones as lookup tables: triggers by 0..255, sticks by value + 32768
+        self._trigger_lut = [0 if v <= self.trig_dz else v for v in range(256)]
+        self._stick_lut = [0 if -self.deadzone < v < self.deadzone else v for v in range(-32768, 32768)]
+        self._thread = None
+        self._stop = threading.Event()
+        self._owner = -1
+        self._last_activity = 0.0
+        self.gamepad = None  # vgamepad.VX360Gamepad
+        self.virtual_slot = -1  # our own slot on Linux, never read back
+        self._pads = None       # evdev reader on Linux, lets the loop sleep until input
+
+        # reused every frame instead of allocating new states
+        self._states = [XINPUT_STATE() for _ in range(4)] if XInputGetState else []
+        self._packets = [None] * 4
+        self._next_probe = [0.0] * 4
+        self._input_changed = False
+
+        # scheduler statistics, see stats()
+        self.current_dt = self.poll_dt
+        self.frame_cost = 0.0   # moving average, seconds
+        self.frames = 0
+        self.updates = 0
+
+    def start(self):
+        if XInputGetState is None and sys.platform != 'win32':
+            print("Virtual controller not supported on this platform")
+            return
+        if vg is None:
+            print("vgamepad not loaded, cannot start VirtualX360")
+            return
+
+        # vgamepad constructs and auto-connects a virtual X360 via ViGEmBus
+        try:
+            self.gamepad = vg.VX360Gamepad()
+        except Exception as e:
+            print(f"Failed to create VX360Gamepad: {e}")
+            return
+
+        # Linux: the uinput pad shows up under /dev/input like any other pad,
+        # reserve its slot so the merger and the UI don't read it back
+        pads = evdev_pads() if sys.platform.startswith('linux') else None
+        if pads is not None:
+            self.virtual_slot = pads.register_virtual_device(self.gamepad.uinput.devnode)
+            self._pads = pads
+
+        # optional: rumble passthrough to active physical pad
+        def on_feedback(client, target, large, small, led, user_data):
+            idx = self._owner
+            if idx >= 0 and XInputSetState:
+                vib = XINPUT_VIBRATION(
+                    wLeftMotorSpeed  = int(large) * 257,  # 0..255 -> 0..65535
+                    wRightMotorSpeed = int(small) * 257,
+                )
+                XInputSetState(idx, ctypes.byref(vib))
+        try:
+            self.gamepad.register_notification(on_feedback)
+        except Exception:
+            # older vgamepad builds may differ; safe to ignore
+            pass
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="VirtualX360", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self.gamepad:
             try:
-                self.gamepad.register_notification(on_feedback)
+                self.gamepad.unregister_notification()
             except Exception:
-                # older vgamepad builds may differ; safe to ignore
                 pass
+            pads = evdev_pads() if sys.platform.startswith('linux') else None
+            if pads is not None:
+                pads.unregister_virtual_device(self.gamepad.uinput.devnode)
+                self.virtual_slot = -1
+                self._pads = None
+            # deleting object disconnects the virtual pad
+            self.gamepad = None
+            
+    def send_neutral(self):
+        if self.gamepad is not None:
+            self.gamepad.reset()
+            self.gamepad.update()
 
-            self._stop.clear()
-            self._thread = threading.Thread(target=self._run, name="VirtualX360", daemon=True)
-            self._thread.start()
-
-        def stop(self):
-            self._stop.set()
-            if self._thread:
-                self._thread.join(timeout=1.0)
-                self._thread = None
-            if self.gamepad:
-                try:
-                    self.gamepad.unregister_notification()
-                except Exception:
-                    pass
-                # deleting object disconnects the virtual pad
-                self.gamepad = None
-                
-        def send_neutral(self):
-            if self.gamepad is not None:
-                self.gamepad.reset()
-                self.gamepad.update()
-
-        def _run(self):
-            last_tuple = None
-            while not self._stop.is_set():
-                owner, state = self._pick_owner()
-                if owner >= 0 and self.gamepad:
-                    tup = (
-                        state.Gamepad.wButtons,
-                        state.Gamepad.bLeftTrigger, state.Gamepad.bRightTrigger,
-                        state.Gamepad.sThumbLX, state.Gamepad.sThumbLY,
-                        state.Gamepad.sThumbRX, state.Gamepad.sThumbRY
-                    )
-                    if tup != last_tuple:
-                        self._apply_to_vpad(state.Gamepad)
-                        self.gamepad.update()
-                        last_tuple = tup
-                time.sleep(self.poll_dt)
-
-        def _pick_owner(self):
-            if not XInputGetState:
-                return -1, None
+    def stats(self):
+        return {
+            'rate_hz': 1.0 / self.current_dt,
+            'frame_cost_us': self.frame_cost * 1e6,
+            'frames': self.frames,
+            'updates': self.updates,
+        }
 
+    def _run(self):
+        last_tuple = None
+        last_change = time.monotonic()
+        sequence = -1
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            owner, state = self._pick_owner()
+            if owner >= 0 and self.gamepad:
+                tup = bytes(state.Gamepad)
+                if tup != last_tuple:
+                    self._apply_to_vpad(state.Gamepad)
+                    self.gamepad.update()
+                    self.updates += 1
+                    last_tuple = tup
+
+            # fast while packets move, then back off towards idle_dt
             now = time.monotonic()
-            # keep current owner if active or within hold
-            if self._owner >= 0:
-                st = XINPUT_STATE()
-                if XInputGetState(self._owner, ctypes.byref(st)) == ERROR_SUCCESS:
-                    if self._has_activity(st.Gamepad):
-                        self._last_activity = now
-                        return self._owner, st
-                    if (now - self._last_activity) < self.idle_hold:
-                        return self._owner, st
-
-            first_conn = None
-            for i in range(4):
-                st = XINPUT_STATE()
-                if XInputGetState(i, ctypes.byref(st)) == ERROR_SUCCESS:
-                    if first_conn is None:
-                        first_conn = (i, st)
-                    if self._has_activity(st.Gamepad):
-                        self._owner = i
-                        self._last_activity = now
-                        return i, st
-
-            if first_conn:
-                self._owner = first_conn[0]
-                return first_conn
-            self._owner = -1
-            return -1, XINPUT_STATE()
-
-        def _has_activity(self, g):
-            if g.wButtons: return True
-            if g.bLeftTrigger > self.trig_dz or g.bRightTrigger > self.trig_dz: return True
-            if abs(g.sThumbLX) > self.deadzone or abs(g.sThumbLY) > self.deadzone: return True
-            if abs(g.sThumbRX) > self.deadzone or abs(g.sThumbRY) > self.deadzone: return True
-            return False
-
-        def _apply_to_vpad(self, g):
-            if vg is None: return
-            # Buttons
-            btn = vg.XUSB_BUTTON
-            mapping = [
-                (0x0001, btn.XUSB_GAMEPAD_DPAD_UP),
-                (0x0002, btn.XUSB_GAMEPAD_DPAD_DOWN),
-                (0x0004, btn.XUSB_GAMEPAD_DPAD_LEFT),
-                (0x0008, btn.XUSB_GAMEPAD_DPAD_RIGHT),
-                (0x0010, btn.XUSB_GAMEPAD_START),
-                (0x0020, btn.XUSB_GAMEPAD_BACK),
-                (0x0040, btn.XUSB_GAMEPAD_LEFT_THUMB),
-                (0x0080, btn.XUSB_GAMEPAD_RIGHT_THUMB),
-                (0x0100, btn.XUSB_GAMEPAD_LEFT_SHOULDER),
-                (0x0200, btn.XUSB_GAMEPAD_RIGHT_SHOULDER),
-                (0x1000, btn.XUSB_GAMEPAD_A),
-                (0x2000, btn.XUSB_GAMEPAD_B),
-                (0x4000, btn.XUSB_GAMEPAD_X),
-                (0x8000, btn.XUSB_GAMEPAD_Y),
-            ]
+            if self._input_changed:
+                self._input_changed = False
+                last_change = now
+                self.current_dt = self.poll_dt
+            elif now - last_change > self.idle_after:
+                self.current_dt = min(self.current_dt * 2, self.idle_dt)
 
-            # clear then set buttons
-            self.gamepad.reset()  # clears buttons & axes
+            self.frames += 1
+            self.frame_cost += (time.perf_counter() - t0 - self.frame_cost) * 0.05
 
-            for mask, vbtn in mapping:
-                if g.wButtons & mask:
-                    self.gamepad.press_button(button=vbtn)
+            if self._pads is not None:
+                # Linux: wake as soon as a pad reports something
+                sequence = self._pads.wait_for_input(sequence, self.current_dt)
+            else:
+                self._stop.wait(self.current_dt)
 
-            # triggers (0..255), deadzone clamp
-            lt = 0 if g.bLeftTrigger  <= self.trig_dz else int(g.bLeftTrigger)
-            rt = 0 if g.bRightTrigger <= self.trig_dz else int(g.bRightTrigger)
-            self.gamepad.left_trigger(value=lt)
-            self.gamepad.right_trigger(value=rt)
+    def _read_slot(self, i, now):
+        """XInputGetState into the reused state of slot i, None if not connected."""
+        if self._packets[i] is None and now < self._next_probe[i]:
+            return None
+        st = self._states[i]
+        if XInputGetState(i, ctypes.byref(st)) != ERROR_SUCCESS:
+            # XInputGetState is slow on empty slots, don't ask every frame
+            self._next_probe[i] = now + self.empty_slot_interval
+            if self._packets[i] is not None:
+                self._packets[i] = None
+                self._input_changed = True
+            return None
+        if st.dwPacketNumber != self._packets[i]:
+            self._packets[i] = st.dwPacketNumber
+            self._input_changed = True
+        return st
 
-            # sticks (-32768..32767), apply deadzone
-            def dz(v): return 0 if -self.deadzone < v < self.deadzone else int(v)
-            self.gamepad.left_joystick(x_value=dz(g.sThumbLX),  y_value=dz(g.sThumbLY))
-            self.gamepad.right_joystick(x_value=dz(g.sThumbRX), y_value=dz(g.sThumbRY))
+    def _pick_owner(self):
+        if not XInputGetState:
+            return -1, None
 
-else:
-    # Non-Windows Dummy
-    class VirtualX360:
-        def __init__(self, poll_hz=250, idle_hold_ms=500, deadzone=6000, trigger_deadzone=5):
-            pass
-        def start(self):
-            print("Virtual controller not supported on this platform")
-        def stop(self):
-            pass
-        def send_neutral(self):
-            pass
\ No newline at end of file
+        now = time.monotonic()
+        # keep current owner if active or within hold
+        if self._owner >= 0 and self._owner != self.virtual_slot:
+            st = self._read_slot(self._owner, now)
+            if st is not None:
+                if self._has_activity(st.Gamepad):
+                    self._last_activity = now
+                    return self._owner, st
+                if (now - self._last_activity) < self.idle_hold:
+                    return self._owner, st
+
+        first_conn = None
+        for i in range(4):
+            if i == self.virtual_slot:
+                continue
+            st = self._read_slot(i, now)
+            if st is not None:
+                if first_conn is None:
+                    first_conn = (i, st)
+                if self._has_activity(st.Gamepad):
+                    self._owner = i
+                    self._last_activity = now
+                    return i, st
+
+        if first_conn:
+            self._owner = first_conn[0]
+            return first_conn
+        self._owner = -1
+        return -1, XINPUT_STATE()
+
+    def _has_activity(self, g):
+        if g.wButtons: return True
+        if (g.bLeftTrigger & 0xFF) > self.trig_dz or (g.bRightTrigger & 0xFF) > self.trig_dz: return True
+        if abs(g.sThumbLX) > self.deadzone or abs(g.sThumbLY) > self.deadzone: return True
+        if abs(g.sThumbRX) > self.deadzone or abs(g.sThumbRY) > self.deadzone: return True
+        return False
+
+    def _apply_to_vpad(self, g):
+        # Buttons are masked, triggers and sticks go through the deadzone tables
+        report = self.gamepad.report
+        report.wButtons = g.wButtons & XUSB_BUTTON_MASK
+        # BYTE is signed in ctypes.wintypes, & 0xFF gives back 0..255
+        report.bLeftTrigger = self._trigger_lut[g.bLeftTrigger & 0xFF]
+        report.bRightTrigger = self._trigger_lut[g.bRightTrigger & 0xFF]
+        stick = self._stick_lut
+        report.sThumbLX = stick[g.sThumbLX + 32768]
+        report.sThumbLY = stick[g.sThumbLY + 32768]
+        report.sThumbRX = stick[g.sThumbRX + 32768]
+        report.sThumbRY = stick[g.sThumbRY + 32768]
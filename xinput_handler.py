@@ -1,41 +1,9 @@
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject
-from ctypes import wintypes
+from PyQt5.QtCore import QTimer, pyqtSignal, QObject, Qt
+from xinput_utils import XINPUT_STATE, XInputGetState, ERROR_SUCCESS, xinput_available, evdev_pads
+import threading
 import ctypes
+import time
 
-import sys
-
-# Load XInput library
-if sys.platform == 'win32':
-    xinput = ctypes.windll.xinput1_4
-    
-    # Define XInput structures and constants
-    class XInputGamepad(ctypes.Structure):
-        _fields_ = [
-            ('wButtons', wintypes.WORD),
-            ('bLeftTrigger', wintypes.BYTE),
-            ('bRightTrigger', wintypes.BYTE),
-            ('sThumbLX', wintypes.SHORT),
-            ('sThumbLY', wintypes.SHORT),
-            ('sThumbRX', wintypes.SHORT),
-            ('sThumbRY', wintypes.SHORT)
-        ]
-
-    class XInputState(ctypes.Structure):
-        _fields_ = [
-            ('dwPacketNumber', wintypes.DWORD),
-            ('Gamepad', XInputGamepad)
-        ]
-else:
-    xinput = None
-    
-    # Dummy structures for non-Windows
-    class XInputGamepad:
-        pass
-        
-    class XInputState:
-        pass
-
-ERROR_SUCCESS = 0
 BUTTONS = {
     0x0001: "DPAD_UP",
     0x0002: "DPAD_DOWN",
@@ -52,6 +20,106 @@ BUTTONS = {
     0x4000: "X",
     0x8000: "Y"
 }
+DPAD_MASK = 0x000F
+
+class XInputBackend(QObject):
+    """
+    Reads the four XInput slots on a dedicated thread and only reports changes.
+
+    Connected slots are read at poll_hz; empty slots are probed again every
+    empty_slot_interval seconds since XInputGetState is slow on them. Signals
+    are emitted from the reader thread and delivered queued to the Qt thread.
+    """
+    buttons_changed = pyqtSignal(int, int)     # slot, wButtons
+    connection_changed = pyqtSignal(object)    # frozenset of connected slots
+
+    def __init__(self, poll_hz=250, empty_slot_interval=1.0):
+        super().__init__()
+        self.poll_dt = 1.0 / float(poll_hz)
+        self.empty_slot_interval = empty_slot_interval
+        self._thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="XInputBackend", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self):
+        connected = set()
+        buttons = [0] * 4
+        packets = [None] * 4
+        next_probe = [0.0] * 4
+        state = XINPUT_STATE()
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+            connection_changed = False
+
+            for slot in range(4):
+                if slot not in connected and now < next_probe[slot]:
+                    continue
+
+                if XInputGetState(slot, ctypes.byref(state)) == ERROR_SUCCESS:
+                    if slot not in connected:
+                        connected.add(slot)
+                        connection_changed = True
+                    # dwPacketNumber only moves when the pad state changed
+                    if state.dwPacketNumber != packets[slot]:
+                        packets[slot] = state.dwPacketNumber
+                        current = state.Gamepad.wButtons
+                        if current != buttons[slot]:
+                            buttons[slot] = current
+                            self.buttons_changed.emit(slot, current)
+                else:
+                    next_probe[slot] = now + self.empty_slot_interval
+                    if slot in connected:
+                        connected.discard(slot)
+                        connection_changed = True
+                        packets[slot] = None
+                        if buttons[slot]:
+                            buttons[slot] = 0
+                            self.buttons_changed.emit(slot, 0)
+
+            if connection_changed:
+                self.connection_changed.emit(frozenset(connected))
+
+            self._wait()
+
+    def _wait(self):
+        self._stop.wait(self.poll_dt)
+
+class EvdevBackend(XInputBackend):
+    """
+    Linux variant: the pads are read by the evdev reader in xinput_utils, so
+    instead of polling this thread sleeps until one of them reports a change.
+    """
+    def __init__(self, pads, poll_hz=250):
+        # slots are cheap to read here, no need to throttle empty ones
+        super().__init__(poll_hz=poll_hz, empty_slot_interval=0.0)
+        self.pads = pads
+        self._sequence = -1
+
+    def _wait(self):
+        # short timeout so stop() is still honoured promptly
+        self._sequence = self.pads.wait_for_input(self._sequence, timeout=0.25)
+
+def create_input_backend(poll_hz=250):
+    """Return the controller backend for this platform, or None if there is none."""
+    pads = evdev_pads()
+    if pads is not None:
+        return EvdevBackend(pads, poll_hz=poll_hz)
+    if xinput_available():
+        return XInputBackend(poll_hz=poll_hz)
+    return None
 
 class XInputHandler(QObject):
     dpad_signal = pyqtSignal(dict)
@@ -64,22 +132,59 @@ class XInputHandler(QObject):
     button_lb_signal = pyqtSignal()
     button_rb_signal = pyqtSignal()
 
-    def __init__(self, settings_label, buttons_label, window, ignore_indices=None):
+    def __init__(self, settings_label, buttons_label, window, ignore_indices=None, poll_hz=250, repeat_ms=100):
         super().__init__()
         self.settings_label = settings_label
         self.buttons_label = buttons_label
         self.window = window
         self.ignore_indices = set(ignore_indices or [])
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.check_xinput_events)
-        self.timer.start(100)
+        self.prev_gamepad_buttons = [0] * 4
+        self.connected = frozenset()
+        self.resync_slots = set()  # slots whose next report is a baseline after resume(), not a press
+
+        # Held D-pad directions repeat like the old 100 ms poll did
+        self.repeat_timer = QTimer()
+        self.repeat_timer.setInterval(repeat_ms)
+        self.repeat_timer.timeout.connect(self._repeat_dpad)
+
+        self.backend = create_input_backend(poll_hz)
+        if self.backend is None:
+            self.settings_label.setText("No controller support on this platform (XInput or evdev)")
+            self.buttons_label.setText("")
+            return
+
+        self.backend.buttons_changed.connect(self.on_buttons_changed, Qt.QueuedConnection)
+        self.backend.connection_changed.connect(self.on_connection_changed, Qt.QueuedConnection)
+        self.update_status_labels()
+        self.backend.start()
+
+    def stop(self):
+        self.repeat_timer.stop()
+        if self.backend is not None:
+            self.backend.stop()
 
+    def suspend(self):
+        """Stop reading the controllers while a game runs, resume() starts again."""
+        self.stop()
+
+    def resume(self):
+        if self.backend is None:
+            return
+        # Start from a clean state, pads may have been unplugged during the game
+        self.repeat_timer.stop()
         self.prev_gamepad_buttons = [0] * 4
+        self.connected = frozenset()
+        self.update_status_labels()
+        # Buttons still held from the game (e.g. the one used to quit it) must
+        # not act on the hub: the first report of every slot is only a baseline
+        self.resync_slots = set(range(4))
+        self.backend.start()
 
     def set_ignore_indices(self, indices):
         s = set(indices or [])
         self.ignore_indices = set() if len(s) >= 4 else s
+        self.update_status_labels()
 
     def _virtual_status_text(self):
         if not self.ignore_indices:
@@ -88,73 +193,88 @@ class XInputHandler(QObject):
         slots_txt = ", ".join(str(i) for i in sorted(self.ignore_indices))
         return f"Virtual controller: enabled (slot {slots_txt})\n"
 
-    def check_xinput_events(self):
-        if not self.window.isActiveWindow():
-            return  # inputs blocked when window isn't focused
+    def on_connection_changed(self, connected):
+        self.connected = connected
+        # the backend reports the buttons of new slots before their connection
+        self.resync_slots.clear()
+        for controller_id in range(4):
+            if controller_id not in connected:
+                # Reset previous state if controller disconnected
+                self.prev_gamepad_buttons[controller_id] = 0
+        self._update_repeat_timer()
+        self.update_status_labels()
 
-        if xinput is None:
-            self.settings_label.setText("XInput not supported on this platform")
-            self.buttons_label.setText("")
+    def on_buttons_changed(self, controller_id, current_buttons):
+        prev_buttons = self.prev_gamepad_buttons[controller_id]
+        self.prev_gamepad_buttons[controller_id] = current_buttons
+        self.update_status_labels()
+
+        if controller_id in self.resync_slots:
+            self.resync_slots.discard(controller_id)
+            prev_buttons = current_buttons
+
+        # Only drive UI actions from NON-ignored slots, and only while focused
+        if controller_id in self.ignore_indices or not self.window.isActiveWindow():
+            self._update_repeat_timer()
             return
 
-        any_controller_connected = False
-        all_pressed_buttons = []
+        # Calculate buttons that were just pressed (rising edge)
+        # (current & ~prev) gives bits that are 1 now but were 0 before
+        just_pressed = current_buttons & ~prev_buttons
 
-        for controller_id in range(4):
-            state = XInputState()
-            result = xinput.XInputGetState(controller_id, ctypes.byref(state))
-            if result == ERROR_SUCCESS:
-                any_controller_connected = True
-
-                # Build the per-line label, mark the virtual (ignored) slot
-                pressed_buttons_text = self.get_pressed_buttons(state.Gamepad.wButtons)
-                if controller_id in self.ignore_indices:
-                    line = f"Aggregator ({controller_id}): {pressed_buttons_text}"
-                else:
-                    line = f"Controller ({controller_id}): {pressed_buttons_text}"
-                all_pressed_buttons.append(line)
-
-                # Only drive UI actions from NON-ignored slots
-                if controller_id not in self.ignore_indices:
-                    current_buttons = state.Gamepad.wButtons
-                    prev_buttons = self.prev_gamepad_buttons[controller_id]
-                    
-                    # Calculate buttons that were just pressed (rising edge)
-                    # (current & ~prev) gives bits that are 1 now but were 0 before
-                    just_pressed = current_buttons & ~prev_buttons
-                    
-                    dpad_state = self.get_dpad_state(current_buttons)
-                    if dpad_state:
-                        self.dpad_signal.emit(dpad_state)
-                        
-                    # Use just_pressed for action buttons to prevent spamming
-                    if just_pressed & 0x1000:
-                        self.button_a_signal.emit()
-                    if just_pressed & 0x2000:
-                        self.button_b_signal.emit()
-                    if just_pressed & 0x4000:
-                        self.button_x_signal.emit()
-                    if just_pressed & 0x8000:
-                        self.button_y_signal.emit()
-                    if just_pressed & 0x0010:
-                        self.button_start_signal.emit()
-                    if just_pressed & 0x0020:
-                        self.button_back_signal.emit()
-                    if just_pressed & 0x0100:
-                        self.button_lb_signal.emit()
-                    if just_pressed & 0x0200:
-                        self.button_rb_signal.emit()
-                        
-                    # Update previous state
-                    self.prev_gamepad_buttons[controller_id] = current_buttons
+        if just_pressed & DPAD_MASK:
+            self.dpad_signal.emit(self.get_dpad_state(current_buttons))
+        self._update_repeat_timer()
+
+        # Use just_pressed for action buttons to prevent spamming
+        if just_pressed & 0x1000:
+            self.button_a_signal.emit()
+        if just_pressed & 0x2000:
+            self.button_b_signal.emit()
+        if just_pressed & 0x4000:
+            self.button_x_signal.emit()
+        if just_pressed & 0x8000:
+            self.button_y_signal.emit()
+        if just_pressed & 0x0010:
+            self.button_start_signal.emit()
+        if just_pressed & 0x0020:
+            self.button_back_signal.emit()
+        if just_pressed & 0x0100:
+            self.button_lb_signal.emit()
+        if just_pressed & 0x0200:
+            self.button_rb_signal.emit()
+
+    def _held_dpad_slots(self):
+        return [i for i in range(4) if i not in self.ignore_indices and self.prev_gamepad_buttons[i] & DPAD_MASK]
+
+    def _update_repeat_timer(self):
+        if self._held_dpad_slots():
+            if not self.repeat_timer.isActive():
+                self.repeat_timer.start()
+        else:
+            self.repeat_timer.stop()
+
+    def _repeat_dpad(self):
+        if not self.window.isActiveWindow():
+            return  # inputs blocked when window isn't focused
+        for controller_id in self._held_dpad_slots():
+            self.dpad_signal.emit(self.get_dpad_state(self.prev_gamepad_buttons[controller_id]))
+
+    def update_status_labels(self):
+        all_pressed_buttons = []
+        for controller_id in sorted(self.connected):
+            # Build the per-line label, mark the virtual (ignored) slot
+            pressed_buttons_text = self.get_pressed_buttons(self.prev_gamepad_buttons[controller_id])
+            if controller_id in self.ignore_indices:
+                line = f"Aggregator ({controller_id}): {pressed_buttons_text}"
             else:
-                # Reset previous state if controller disconnected
-                self.prev_gamepad_buttons[controller_id] = 0
+                line = f"Controller ({controller_id}): {pressed_buttons_text}"
+            all_pressed_buttons.append(line)
 
-        # Prefix the status label with virtual status (enabled + slot list) 
+        # Prefix the status label with virtual status (enabled + slot list)
         virtual_status = self._virtual_status_text()
 
-        if any_controller_connected:
+        if self.connected:
             header_text = "CONTROLLER(S) CONNECTED\n" + virtual_status
             body_text = "\n".join(all_pressed_buttons) if all_pressed_buttons else "No buttons pressed"
         else:
@@ -164,6 +284,7 @@ class XInputHandler(QObject):
         # buttons_label is the top label, settings_label is the bottom label
         self.buttons_label.setText(header_text)
         self.settings_label.setText(body_text)
+
     def get_pressed_buttons(self, wButtons):
         pressed_buttons = [name for bitmask, name in BUTTONS.items() if wButtons & bitmask]
         return ", ".join(pressed_buttons) if pressed_buttons else "No buttons pressed"
@@ -174,4 +295,4 @@ class XInputHandler(QObject):
             'down': bool(wButtons & 0x0002),
             'left': bool(wButtons & 0x0004),
             'right': bool(wButtons & 0x0008)
-        }
\ No newline at end of file
+        }
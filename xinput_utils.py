@@ -1,8 +1,14 @@
 import ctypes
 from ctypes import wintypes
 import sys
+import os
+import glob
+import select
+import threading
+import time
 
 _xinput = None
+libevdev = None
 
 # try multiple DLLs for compatibility
 if sys.platform == 'win32':
@@ -15,11 +21,18 @@ if sys.platform == 'win32':
     if _xinput is None:
         # It's possible to be on Windows but missing DLLs, or just not found
         pass
+elif sys.platform.startswith('linux'):
+    # Linux: physical pads are read from /dev/input/event* through libevdev
+    try:
+        import libevdev
+    except (ImportError, OSError):
+        # python-libevdev missing, or the libevdev.so it wraps
+        libevdev = None
 else:
-    # Non-Windows: no XInput
+    # Other platforms: no XInput
     pass
 
-if _xinput:
+if _xinput or libevdev:
     class XINPUT_GAMEPAD(ctypes.Structure):
         _fields_ = [
             ("wButtons",      wintypes.WORD),
@@ -34,24 +47,323 @@ if _xinput:
     class XINPUT_STATE(ctypes.Structure):
         _fields_ = [("dwPacketNumber", wintypes.DWORD), ("Gamepad", XINPUT_GAMEPAD)]
 
-    XInputGetState = _xinput.XInputGetState
-    XInputGetState.argtypes = [wintypes.DWORD, ctypes.POINTER(XINPUT_STATE)]
-    XInputGetState.restype  = wintypes.DWORD
     ERROR_SUCCESS = 0
+    ERROR_DEVICE_NOT_CONNECTED = 1167
 else:
     # Dummy definitions to avoid NameErrors if referenced
     class XINPUT_GAMEPAD: pass
     class XINPUT_STATE: pass
     ERROR_SUCCESS = 0
+    ERROR_DEVICE_NOT_CONNECTED = 1167
+
+if _xinput:
+    XInputGetState = _xinput.XInputGetState
+    XInputGetState.argtypes = [wintypes.DWORD, ctypes.POINTER(XINPUT_STATE)]
+    XInputGetState.restype  = wintypes.DWORD
+
+elif libevdev:
+    # evdev key code -> XInput wButtons bit
+    EVDEV_BUTTONS = {
+        libevdev.EV_KEY.BTN_DPAD_UP.value:    0x0001,
+        libevdev.EV_KEY.BTN_DPAD_DOWN.value:  0x0002,
+        libevdev.EV_KEY.BTN_DPAD_LEFT.value:  0x0004,
+        libevdev.EV_KEY.BTN_DPAD_RIGHT.value: 0x0008,
+        libevdev.EV_KEY.BTN_START.value:      0x0010,
+        libevdev.EV_KEY.BTN_SELECT.value:     0x0020,
+        libevdev.EV_KEY.BTN_THUMBL.value:     0x0040,
+        libevdev.EV_KEY.BTN_THUMBR.value:     0x0080,
+        libevdev.EV_KEY.BTN_TL.value:         0x0100,
+        libevdev.EV_KEY.BTN_TR.value:         0x0200,
+        libevdev.EV_KEY.BTN_MODE.value:       0x0400,
+        libevdev.EV_KEY.BTN_SOUTH.value:      0x1000,
+        libevdev.EV_KEY.BTN_EAST.value:       0x2000,
+        libevdev.EV_KEY.BTN_NORTH.value:      0x4000,
+        libevdev.EV_KEY.BTN_WEST.value:       0x8000,
+    }
+    # evdev axis code -> XINPUT_GAMEPAD field, sticks are -32768..32767 with Y up
+    EVDEV_STICKS = {
+        libevdev.EV_ABS.ABS_X.value:  ("sThumbLX", False),
+        libevdev.EV_ABS.ABS_Y.value:  ("sThumbLY", True),
+        libevdev.EV_ABS.ABS_RX.value: ("sThumbRX", False),
+        libevdev.EV_ABS.ABS_RY.value: ("sThumbRY", True),
+    }
+    EVDEV_TRIGGERS = {
+        libevdev.EV_ABS.ABS_Z.value:  "bLeftTrigger",
+        libevdev.EV_ABS.ABS_RZ.value: "bRightTrigger",
+    }
+    EVDEV_DIGITAL_TRIGGERS = {
+        libevdev.EV_KEY.BTN_TL2.value: ("bLeftTrigger", libevdev.EV_ABS.ABS_Z),
+        libevdev.EV_KEY.BTN_TR2.value: ("bRightTrigger", libevdev.EV_ABS.ABS_RZ),
+    }
+    HAT_X = libevdev.EV_ABS.ABS_HAT0X.value
+    HAT_Y = libevdev.EV_ABS.ABS_HAT0Y.value
+
+    class EvdevPad:
+        """
+        One physical pad opened from /dev/input, mirrored into an XINPUT_STATE.
+        An already opened device (anything with absinfo, has() and events())
+        can be given instead, path is then only its name.
+        """
+        def __init__(self, path, device=None):
+            self.path = path
+            self.file = None
+            if device is None:
+                self.file = open(path, 'rb')
+                os.set_blocking(self.file.fileno(), False)
+                device = libevdev.Device(self.file)
+            self.dev = device
+            self.state = XINPUT_STATE()
+            self.pending = XINPUT_GAMEPAD()
+            self.hat = [0, 0]
+            self.ranges = {}
+            for code in list(EVDEV_STICKS) + list(EVDEV_TRIGGERS):
+                info = self.dev.absinfo[libevdev.evbit(libevdev.EV_ABS.value, code)]
+                if info is not None and info.maximum != info.minimum:
+                    self.ranges[code] = (info.minimum, info.maximum)
+
+        def fileno(self):
+            return self.file.fileno()
+
+        def close(self):
+            if self.file is None:
+                return
+            try:
+                self.file.close()
+            except OSError:
+                pass
+
+        def read(self):
+            """Apply all pending events, return True if the XInput state changed."""
+            changed = False
+            try:
+                for e in self.dev.events():
+                    changed |= self._apply(e)
+            except libevdev.EventsDroppedException:
+                for e in self.dev.sync():
+                    changed |= self._apply(e)
+            return changed
+
+        def _apply(self, e):
+            code = e.code.value
+            if e.type == libevdev.EV_KEY:
+                bit = EVDEV_BUTTONS.get(code)
+                if bit is not None:
+                    if e.value:
+                        self.pending.wButtons |= bit
+                    else:
+                        self.pending.wButtons &= ~bit
+                elif code in EVDEV_DIGITAL_TRIGGERS:
+                    field, analog = EVDEV_DIGITAL_TRIGGERS[code]
+                    # only pads without an analog trigger axis
+                    if not self.dev.has(analog):
+                        setattr(self.pending, field, 255 if e.value else 0)
+            elif e.type == libevdev.EV_ABS:
+                if code == HAT_X or code == HAT_Y:
+                    self.hat[code - HAT_X] = e.value
+                    dpad = 0
+                    if self.hat[1] < 0: dpad |= 0x0001
+                    if self.hat[1] > 0: dpad |= 0x0002
+                    if self.hat[0] < 0: dpad |= 0x0004
+                    if self.hat[0] > 0: dpad |= 0x0008
+                    self.pending.wButtons = (self.pending.wButtons & ~0x000F) | dpad
+                elif code in EVDEV_STICKS:
+                    field, invert = EVDEV_STICKS[code]
+                    setattr(self.pending, field, self._scale_stick(code, e.value, invert))
+                elif code in EVDEV_TRIGGERS:
+                    setattr(self.pending, EVDEV_TRIGGERS[code], self._scale_trigger(code, e.value))
+            elif e.matches(libevdev.EV_SYN.SYN_REPORT):
+                # like XInput, the packet number only moves when the state changed
+                if bytes(self.pending) != bytes(self.state.Gamepad):
+                    ctypes.memmove(ctypes.addressof(self.state.Gamepad), ctypes.addressof(self.pending), ctypes.sizeof(XINPUT_GAMEPAD))
+                    self.state.dwPacketNumber = (self.state.dwPacketNumber + 1) & 0xFFFFFFFF
+                    return True
+            return False
+
+        def _scale_stick(self, code, value, invert):
+            lo, hi = self.ranges.get(code, (-32768, 32767))
+            v = int((value - lo) * 65535 / (hi - lo)) - 32768
+            if invert:
+                v = -1 - v
+            return max(-32768, min(32767, v))
+
+        def _scale_trigger(self, code, value):
+            lo, hi = self.ranges.get(code, (0, 255))
+            return max(0, min(255, int((value - lo) * 255 / (hi - lo))))
+
+    class EvdevPads:
+        """
+        Maps the gamepads under /dev/input to four XInput-like slots.
+
+        A reader thread blocks in select() on every opened pad and rescans
+        /dev/input every rescan_interval seconds for hotplugged devices. Virtual
+        pads created by this process are registered so they take a slot and
+        report a neutral state without ever being read back.
+        """
+        def __init__(self, rescan_interval=2.0):
+            self.rescan_interval = rescan_interval
+            self.slots = [None] * 4           # EvdevPad, a virtual devnode, or None
+            self.virtual_nodes = set()
+            self.rejected = set()             # paths that are not gamepads
+            self.lock = threading.Lock()
+            self.changed = threading.Condition(self.lock)
+            self.sequence = 0
+            self._thread = None
+
+        def start(self):
+            with self.lock:
+                if self._thread is not None:
+                    return
+                self._thread = threading.Thread(target=self._run, name="EvdevPads", daemon=True)
+            # first scan inline so the pads are known as soon as start() returns
+            self.rescan()
+            self._thread.start()
+
+        def get_state(self, index, state_ref):
+            with self.lock:
+                if not 0 <= index < 4 or self.slots[index] is None:
+                    return ERROR_DEVICE_NOT_CONNECTED
+                pad = self.slots[index]
+                if isinstance(pad, EvdevPad):
+                    ctypes.memmove(state_ref, ctypes.addressof(pad.state), ctypes.sizeof(XINPUT_STATE))
+                else:
+                    ctypes.memset(state_ref, 0, ctypes.sizeof(XINPUT_STATE))
+                return ERROR_SUCCESS
+
+        def wait_for_input(self, sequence, timeout):
+            """Block until a pad changed after `sequence` (or timeout), return the current sequence."""
+            with self.changed:
+                if self.sequence == sequence:
+                    self.changed.wait(timeout)
+                return self.sequence
+
+        def register_virtual_device(self, devnode):
+            """Give a virtual pad created by this process its own slot, return the slot or -1."""
+            with self.lock:
+                self.virtual_nodes.add(devnode)
+                for i, pad in enumerate(self.slots):
+                    if isinstance(pad, EvdevPad) and pad.path == devnode:
+                        pad.close()
+                        self.slots[i] = devnode
+                        break
+                else:
+                    self._assign_slot(devnode)
+                self._notify()
+                return self.slots.index(devnode) if devnode in self.slots else -1
+
+        def unregister_virtual_device(self, devnode):
+            with self.lock:
+                self.virtual_nodes.discard(devnode)
+                for i, pad in enumerate(self.slots):
+                    if pad == devnode:
+                        self.slots[i] = None
+                self._notify()
+
+        def rescan(self):
+            paths = set(glob.glob('/dev/input/event*'))
+            with self.lock:
+                known = {pad.path if isinstance(pad, EvdevPad) else pad for pad in self.slots if pad is not None}
+                self.rejected &= paths
+                candidates = sorted(paths - known - self.rejected - self.virtual_nodes)
+
+            opened = []
+            for path in candidates:
+                try:
+                    pad = EvdevPad(path)
+                except OSError:
+                    self.rejected.add(path)
+                    continue
+                if pad.dev.has(libevdev.EV_KEY.BTN_SOUTH):
+                    opened.append(pad)
+                else:
+                    pad.close()
+                    self.rejected.add(path)
+
+            if opened:
+                with self.lock:
+                    for pad in opened:
+                        if pad.path in self.virtual_nodes or not self._assign_slot(pad):
+                            pad.close()
+                    self._notify()
+
+        def _assign_slot(self, pad):
+            for i in range(4):
+                if self.slots[i] is None:
+                    self.slots[i] = pad
+                    return True
+            return False
+
+        def _drop(self, pad):
+            pad.close()
+            with self.lock:
+                for i in range(4):
+                    if self.slots[i] is pad:
+                        self.slots[i] = None
+                self._notify()
+
+        def _notify(self):
+            # caller holds self.lock
+            self.sequence += 1
+            self.changed.notify_all()
+
+        def _run(self):
+            next_rescan = time.monotonic() + self.rescan_interval
+            while True:
+                with self.lock:
+                    pads = [p for p in self.slots if isinstance(p, EvdevPad)]
+
+                timeout = max(0.0, next_rescan - time.monotonic())
+                try:
+                    ready = select.select(pads, [], [], timeout)[0] if pads else []
+                except (OSError, ValueError):
+                    ready = []  # a pad was closed under us, pick up the new set
+                if not pads:
+                    time.sleep(timeout)
+
+                for pad in ready:
+                    try:
+                        changed = pad.read()
+                    except OSError:
+                        # unplugged
+                        self._drop(pad)
+                        continue
+                    if changed:
+                        with self.lock:
+                            self._notify()
+
+                if time.monotonic() >= next_rescan:
+                    self.rescan()
+                    next_rescan = time.monotonic() + self.rescan_interval
+
+    _evdev_pads = EvdevPads()
+
+    def XInputGetState(index, state_ref):
+        """Same contract as the XInput call, state_ref is a byref(XINPUT_STATE)."""
+        _evdev_pads.start()
+        return _evdev_pads.get_state(index, state_ref)
+
+else:
     def XInputGetState(*args): return -1
 
+def xinput_available():
+    return _xinput is not None or libevdev is not None
+
+def evdev_available():
+    return libevdev is not None and _xinput is None
+
+def evdev_pads():
+    """The shared Linux pad reader, started on first use, or None on other platforms."""
+    if not evdev_available():
+        return None
+    _evdev_pads.start()
+    return _evdev_pads
+
 def xinput_connected_indices():
     s = set()
-    if _xinput is None:
+    if not xinput_available():
         return s
-        
+
     for i in range(4):
         st = XINPUT_STATE()
         if XInputGetState(i, ctypes.byref(st)) == ERROR_SUCCESS:
             s.add(i)
-    return s
\ No newline at end of file
+    return s